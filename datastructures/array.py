@@ -6,102 +6,574 @@
 """
 
 from __future__ import annotations
-from collections.abc import Sequence
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from itertools import repeat
+import numbers
 import os
-from typing import Any, Iterator, overload
+from typing import Any, Callable, Iterator, overload
 import numpy as np
 from numpy.typing import NDArray
-import copy
+from copy import deepcopy
 
 from datastructures.iarray import IArray, T
+from datastructures.mappedfile import MappedFile
+from datastructures.parallel import parallel_map, parallel_reduce
+from datastructures.recordlayout import RecordLayout
+
+# data types that are stored unboxed in a native numpy buffer instead of an object buffer
+_NATIVE_DTYPES = {bool: np.dtype(np.bool_), int: np.dtype(np.int64), float: np.dtype(np.float64)}
+# numpy dtype kinds that are accepted as input for each native data type
+_NATIVE_KINDS = {bool: 'b', int: 'biu', float: 'f'}
+# the scalars native Arrays compare and compute with; np.bool_ is not registered as a numbers.Number
+_SCALARS = (numbers.Number, np.bool_)
+# the number of items iterators convert to Python values at a time
+_ITERATION_BLOCK = 256
+
+
+def _data_type_of(dtype: np.dtype) -> type:
+    # the data type an Array or Array2D uses for items of a numpy dtype, see Array.from_numpy
+    for native_type, kinds in _NATIVE_KINDS.items():
+        if dtype.kind in kinds and np.can_cast(dtype, _NATIVE_DTYPES[native_type]):
+            return native_type
+    return str if dtype.kind == 'U' else object
 
 
 class Array(IArray[T]):  
 
-    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object) -> None: 
-        if not isinstance(starting_sequence, Sequence):
+    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object, growth_factor: float=2, shrink_threshold: float=0.25,
+                 records: bool=False) -> None: 
+        # buffer-sharing counter for copy-on-write slices, and whether someone else holds the buffer: it was
+        # handed out by __array__ or __buffer__, or borrowed by from_numpy. See __slice_view and __relocate
+        self.__shared = [1]
+        self.__exported = False
+        if not isinstance(starting_sequence, (Sequence, np.ndarray)):
             raise ValueError("This should raise because starting_sequence is not a sequence")
         if not isinstance(data_type, type):
             raise ValueError("This should raise because data_type is not a type, it's a data value")
-        for item in starting_sequence:
-            if not isinstance(item, data_type):
-                raise TypeError
+        self.__check_resize_policy(growth_factor, shrink_threshold)
+        self.__growth_factor = growth_factor
+        self.__shrink_threshold = shrink_threshold
+        self.__reserved = 0
+        self.__mapping: MappedFile | None = None
+        # records=True packs dataclass instances into a structured dtype, see field
+        self.__layout = RecordLayout(data_type) if records else None
         self.__data_type = data_type
+        self.__dtype = self.__layout.dtype if self.__layout else _NATIVE_DTYPES.get(data_type, np.dtype(object))
         self.__element_count = len(starting_sequence)
         self.__capacity = len(starting_sequence)
+        self.__head = 0
+        # bumped by every change to the length or order of the items, so iterators can notice them
+        self.__modifications = 0
+
+        self.__elements = self.__buffer(starting_sequence, copy=True)
+        # true while the items are known to be in ascending order, see sort
+        self.__sorted = self.__in_order(self.__elements)
+
+    @staticmethod
+    def with_capacity(capacity: int, data_type: type=object) -> Array[T]:
+        """ Create an empty Array whose buffer already has room for capacity items, so the
+            first capacity appends never reallocate.
+
+        Args:
+            capacity (int): the physical size to allocate up front.
+            data_type (type): the data type of the Array (default=object).
+
+        Returns:
+            array (Array[T]): an empty Array with the requested physical size.
+
+        Raises:
+            ValueError: if capacity is negative.
+        """
+        array = Array(data_type=data_type)
+        array.reserve(capacity)
+        return array
+
+    @staticmethod
+    def from_iterable(iterable: Iterable[T], data_type: type=object, copy: bool=True) -> Array[T]:
+        """ Build an Array from any iterable with a single allocation and one bulk type check.
+
+        Args:
+            iterable (Iterable[T]): the items to store.
+            data_type (type): the data type of the Array (default=object).
+            copy (bool): deep copy object items (default=True). Pass False for trusted input
+                that the Array may store by reference.
+
+        Returns:
+            array (Array[T]): an Array holding the items, with physical size equal to logical size.
+
+        Raises:
+            TypeError: if any item is not of data_type.
+        """
+        items = iterable if isinstance(iterable, (Sequence, np.ndarray)) else list(iterable)
+        array = Array(data_type=data_type)
+        array.__relocate(len(items), 0)
+        array.extend(items, copy=copy)
+        return array
+
+    @staticmethod
+    def from_numpy(ndarray: NDArray, copy: bool=False) -> Array[Any]:
+        """ Wrap a one-dimensional numpy array in an Array. The data type is taken from the dtype:
+            bool, integer and float arrays become bool, int and float Arrays, unicode arrays become
+            str Arrays and anything else becomes an object Array.
+
+        Examples:
+            >>> values = np.arange(5)
+            >>> array = Array.from_numpy(values)
+            >>> array[0] = 10
+            >>> print(values)
+            [10  1  2  3  4]
+
+        Args:
+            ndarray (NDArray): the numpy array to wrap.
+            copy (bool): copy the data instead of sharing it (default=False). Without a copy the Array
+                and ndarray share memory until the Array reallocates; a copy is always made if the
+                dtype has to be converted.
+
+        Returns:
+            array (Array[Any]): an Array holding the items of ndarray.
+
+        Raises:
+            ValueError: if ndarray is not a one-dimensional numpy array.
+        """
+        if not isinstance(ndarray, np.ndarray) or ndarray.ndim != 1:
+            raise ValueError("from_numpy needs a one-dimensional numpy array")
+        array = Array(data_type=_data_type_of(ndarray.dtype))
+        array.__elements = ndarray.astype(array.__dtype, copy=copy)
+        # the caller still holds a borrowed buffer, so it is treated like an exported one
+        array.__exported = array.__elements is ndarray
+        array.__element_count = array.__capacity = len(ndarray)
+        array.__sorted = array.__in_order(array.__elements)
+        return array
+
+    @staticmethod
+    def memmap(path: str | os.PathLike, data_type: type | None=None, readonly: bool=False) -> Array[Any]:
+        """ Open a file-backed Array, creating the file if it does not exist. The items live in an np.memmap
+            over the file, so only the parts that are read or written are loaded into memory, and appending past
+            the capacity extends the file. Call flush() to make the items and logical length durable.
+            Slices of a file-backed Array read straight from the file and see later changes to it.
+
+        Examples:
+            >>> array = Array.memmap('numbers.bin', data_type=int)
+            >>> array.extend(range(1_000_000))
+            >>> array.flush()
+            >>> print(Array.memmap('numbers.bin', readonly=True)[10:13])
+            [10, 11, 12]
+
+        Args:
+            path (str | os.PathLike): the file holding the Array.
+            data_type (type | None): bool, int or float. Required to create a file; if given for an
+                existing file it must match the file.
+            readonly (bool): map the file read-only (default=False).
+
+        Returns:
+            array (Array[Any]): the file-backed Array.
 
-        self.__elements = np.empty(self.__capacity, dtype=self.__data_type)
-        for index in range(len(starting_sequence)):
-            self.__elements[index] = copy.deepcopy(starting_sequence[index])
+        Raises:
+            ValueError: if data_type can't be memory-mapped or does not match the file.
+            FileNotFoundError: if readonly is set and the file does not exist.
+        """
+        if data_type is not None and data_type not in _NATIVE_DTYPES:
+            raise ValueError("Only bool, int and float Arrays can be memory-mapped")
+        mapping = MappedFile(path, _NATIVE_DTYPES.get(data_type), readonly)
+        data_type = next(native_type for native_type, dtype in _NATIVE_DTYPES.items() if dtype == mapping.dtype)
+        array = Array(data_type=data_type)
+        array.__mapping = mapping
+        array.__elements = mapping.buffer
+        array.__element_count, array.__capacity, array.__head = mapping.length, mapping.capacity, mapping.head
+        # checking the order would read the whole file
+        array.__sorted = array.__element_count <= 1
+        return array
+
+    def flush(self) -> None:
+        """ Write the items and logical length of a file-backed Array to disk. Does nothing for in-memory Arrays. """
+        if self.__mapping is not None:
+            self.__mapping.flush(self.__element_count, self.__head)
 
     @overload
     def __getitem__(self, index: int) -> T: ...
     @overload
     def __getitem__(self, index: slice) -> Sequence[T]: ...
-    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+    def __getitem__(self, index: int | slice | Array[bool] | NDArray) -> T | Sequence[T]:
         if isinstance(index, int):
-            if index > 0 and index >= self.__element_count:
+            if not (-self.__element_count <= index and index < self.__element_count):
                 raise IndexError("Index out of bounds")   
-            if index < 0 and index < -self.__element_count:
-                raise IndexError("Index out of bounds")
             if index < 0:
                 index += self.__element_count
-            item = self.__elements[index]
+            item = self.__elements[self.__head + index]
+            if self.__layout is not None:
+                return self.__layout.decode(item.item())
             return item.item() if isinstance(item, np.generic) else item
+        elif self.__is_mask(index):
+            # boolean mask selection copies the selected items into a new Array
+            selected = self.__slice_view(self.__view()[np.asarray(index)])
+            selected.__release()
+            selected.__sorted = self.__sorted
+            return selected
         elif isinstance(index, slice):
-            start = index.start
-            if start < 0:
-                start = self.__element_count + start
-            if index.stop == None:
-                stop = self.__element_count
-            else:
-                stop = index.stop
-            step = index.step
-
-            if start > 0 and start >= self.__element_count:
-                raise IndexError("Index out of bounds")
-            if start < 0 and start <= -self.__element_count:
-                raise IndexError("Index out of bounds")
-            if stop > 0 and stop > self.__element_count:
-                raise IndexError("Index out of bounds")
-            if stop < 0 and stop < -self.__element_count:
-                raise IndexError("Index out of bounds")
-
-            sliced_items = self.__elements[start:stop:step]
-
-            return Array(starting_sequence=sliced_items.tolist(), data_type=self.__data_type)
+            for bound in (index.start, index.stop):
+                if bound is not None and not (-self.__element_count <= bound <= self.__element_count):
+                    raise IndexError("Index out of bounds")
+            view = self.__slice_view(self.__view()[index])
+            view.__sorted = self.__sorted and (index.step is None or index.step > 0)
+            return view
         else:
             raise TypeError
     
     def __setitem__(self, index: int, item: T) -> None:
-        if not isinstance(item, self.__data_type):
+        if not self.__is_valid(item):
             raise TypeError("Item is wrong type")
-        elif not (-self.__element_count < index and index < self.__element_count):
+        elif not (-self.__element_count <= index and index < self.__element_count):
             raise IndexError("Index out of bounds")
         else:
-            self.__elements[index] = item
+            if index < 0:
+                index += self.__element_count
+            record = self.__encode(item)
+            self.__detach()
+            self.__sorted = self.__keeps_order(index, index + 1, (item,))
+            self.__elements[self.__head + index] = record
 
     def append(self, data: T) -> None:
-        if not isinstance(data, self.__data_type):
+        if not self.__is_valid(data):
             raise TypeError("Data type does not match array")
+        record = self.__encode(data)
         self.__grow(self.__element_count + 1)
+        self.__detach()
+        self.__sorted = self.__keeps_order(self.__element_count, self.__element_count, (data,))
+        self.__elements[self.__head + self.__element_count] = record
         self.__element_count += 1
-        self.__elements[self.__element_count - 1] = data
+        self.__modifications += 1
 
     def append_front(self, data: T) -> None:
-        if not isinstance(data, self.__data_type):
+        if not self.__is_valid(data):
             raise TypeError("Data type does not match array")
-        self.__grow(self.__element_count + 1)
+        record = self.__encode(data)
+        self.__grow(self.__element_count + 1, front=True)
+        self.__detach()
+        self.__sorted = self.__keeps_order(0, 0, (data,))
+        self.__head -= 1
+        self.__elements[self.__head] = record
         self.__element_count += 1
-        for index in range(self.__element_count - 1, 0, -1):   
-            self.__elements[index] = self.__elements[index - 1]
-        self.__elements[0] = data
+        self.__modifications += 1
+
+    def extend(self, items: Iterable[T], copy: bool=True) -> None:
+        """ Append every item to the end of the Array, resizing at most once. All items are
+            validated before anything is stored, so a TypeError leaves the Array unchanged.
+
+        Args:
+            items (Iterable[T]): the items to append.
+            copy (bool): deep copy object items (default=True). Pass False to store them by reference.
+
+        Raises:
+            TypeError: if any item is not of the Array's data type.
+        """
+        if isinstance(items, Array):
+            items = items.__view() if items.__layout is None else items.__items(items.__view())
+        elif not isinstance(items, (Sequence, np.ndarray)):
+            items = list(items)
+        buffer = self.__buffer(items, copy)
+        self.__grow(self.__element_count + len(buffer))
+        self.__detach()
+        self.__sorted = self.__keeps_order(self.__element_count, self.__element_count, buffer)
+        tail = self.__head + self.__element_count
+        self.__elements[tail:tail + len(buffer)] = buffer
+        self.__element_count += len(buffer)
+        self.__modifications += 1
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert an item before index, shifting whichever side of index is shorter by one slot.
+
+        Args:
+            index (int): the position the item will have. len(array) (or -0) appends.
+            item (T): the item to insert.
+
+        Raises:
+            IndexError: if index is out of bounds.
+            TypeError: if item is not of the Array's data type.
+        """
+        if not self.__is_valid(item):
+            raise TypeError("Data type does not match array")
+        self.insert_many(index, [item], copy=False)
+
+    def insert_many(self, index: int, items: Iterable[T], copy: bool=True) -> None:
+        """ Insert all items before index with one resize and one bulk shift of the shorter side.
+
+        Examples:
+            >>> array = Array[int](starting_sequence=[0, 1, 5], data_type=int)
+            >>> array.insert_many(2, [2, 3, 4])
+            >>> print(array)
+            [0, 1, 2, 3, 4, 5]
+
+        Args:
+            index (int): the position the first item will have.
+            items (Iterable[T]): the items to insert.
+            copy (bool): deep copy object items (default=True). Pass False to store them by reference.
+
+        Raises:
+            IndexError: if index is out of bounds.
+            TypeError: if any item is not of the Array's data type. The Array is left unchanged.
+        """
+        if not (-self.__element_count <= index and index <= self.__element_count):
+            raise IndexError("Index out of bounds")
+        if index < 0:
+            index += self.__element_count
+        if isinstance(items, Array):
+            items = items.__view() if items.__layout is None else items.__items(items.__view())
+        elif not isinstance(items, (Sequence, np.ndarray)):
+            items = list(items)
+        buffer = self.__buffer(items, copy)
+        self.__sorted = self.__keeps_order(index, index, buffer)
+        count, shift = self.__element_count, len(buffer)
+        if index < count - index:
+            # closer to the front: move the items before index left to open the gap
+            self.__grow(count + shift, front=True)
+            self.__detach()
+            head = self.__head
+            self.__elements[head - shift:head - shift + index] = self.__elements[head:head + index]
+            self.__head -= shift
+        else:
+            self.__grow(count + shift)
+            self.__detach()
+            head = self.__head
+            self.__elements[head + index + shift:head + count + shift] = self.__elements[head + index:head + count]
+        self.__elements[self.__head + index:self.__head + index + shift] = buffer
+        self.__element_count += shift
+        self.__modifications += 1
+
+    def delete_range(self, start: int, stop: int) -> None:
+        """ Delete the items in [start, stop) with one bulk shift of the shorter remaining side, then
+            check once whether the Array should shrink.
+
+        Args:
+            start (int): the index of the first item to delete.
+            stop (int): the index after the last item to delete. Nothing is deleted if stop <= start.
+
+        Raises:
+            IndexError: if start or stop is out of bounds.
+        """
+        for bound in (start, stop):
+            if not (-self.__element_count <= bound and bound <= self.__element_count):
+                raise IndexError("Index out of bounds")
+        start, stop, _ = slice(start, stop).indices(self.__element_count)
+        if stop <= start:
+            return
+        self.__detach()
+        head, tail, gap = self.__head, self.__head + self.__element_count, stop - start
+        if start < self.__element_count - stop:
+            # closer to the front: shift the items before start right over the gap
+            self.__elements[head + gap:head + stop] = self.__elements[head:head + start]
+            self.__head += gap
+            self.__vacate(head, head + gap)
+        else:
+            self.__elements[head + start:tail - gap] = self.__elements[head + stop:tail]
+            self.__vacate(tail - gap, tail)
+        self.__element_count -= gap
+        self.__modifications += 1
+        self.__shrink(self.__element_count)
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """ Remove every item for which predicate returns True, keeping the order of the rest. The survivors
+            are compacted in one bulk move and the Array shrinks at most once.
+
+        Args:
+            predicate (Callable[[T], bool]): called once per item.
+
+        Returns:
+            removed (int): the number of items removed.
+        """
+        items = self.__view()
+        keep = np.fromiter((not predicate(item) for item in self.__items(items)), dtype=bool, count=len(items))
+        kept = items[keep]
+        removed = self.__element_count - len(kept)
+        if removed:
+            self.__detach()
+            self.__elements[self.__head:self.__head + len(kept)] = kept
+            self.__vacate(self.__head + len(kept), self.__head + self.__element_count)
+            self.__element_count = len(kept)
+            self.__modifications += 1
+            self.__shrink(self.__element_count)
+        return removed
+
+    def parallel_map(self, fn: Callable[[T], Any], workers: int | None=None, data_type: type | None=None) -> Array[Any]:
+        """ Return a new Array holding fn(item) for every item, computed by a pool of worker processes.
+            bool, int and float buffers are shared with the workers through shared memory instead of pickled.
+            fn must be picklable, so define it at the top level of a module rather than as a lambda.
+
+        Args:
+            fn (Callable[[T], Any]): called once per item, in a worker process.
+            workers (int | None): the number of processes (default=None, one per CPU). 1 runs fn in this process.
+            data_type (type | None): the data type of the results (default=None, the data type of this Array).
+
+        Returns:
+            results (Array[Any]): the results, in the order of the items.
+
+        Raises:
+            ValueError: if workers is less than 1.
+            TypeError: if a result does not match data_type.
+        """
+        results = parallel_map(self.__parallel_items(), fn, workers)
+        return Array.from_iterable(results, data_type=self.__data_type if data_type is None else data_type, copy=False)
+
+    def parallel_reduce(self, fn: Callable[[Any, T], Any], initial: Any, workers: int | None=None) -> Any:
+        """ Fold the items into initial with fn, using a pool of worker processes. Every worker folds a few
+            chunks of the Array and the partial results are then folded in order, so fn must be associative
+            (sums, products, min, max...) and picklable, like the fn of parallel_map.
+
+        Args:
+            fn (Callable[[Any, T], Any]): combines two values.
+            initial (Any): the value the fold starts from, returned as is for an empty Array.
+            workers (int | None): the number of processes (default=None, one per CPU). 1 folds in this process.
+
+        Returns:
+            result (Any): the folded value.
+
+        Raises:
+            ValueError: if workers is less than 1.
+        """
+        return parallel_reduce(self.__parallel_items(), fn, initial, workers)
+
+    def sort(self, key: Callable[[T], Any] | None=None, reverse: bool=False) -> None:
+        """ Sort the Array in place. bool, int and float Arrays sorted without a key use np.sort on the
+            buffer; everything else uses Python's stable Timsort. Sorting in ascending order without a key
+            marks the Array as sorted (see is_sorted).
+
+        Args:
+            key (Callable[[T], Any] | None): computes the value each item is compared by (default=None).
+            reverse (bool): sort in descending order (default=False).
+        """
+        self.__detach()
+        items = self.__view()
+        if self.__is_native() and key is None:
+            items.sort()
+            if reverse:
+                items[:] = items[::-1]
+        else:
+            ordered = sorted(self.__items(items), key=key, reverse=reverse)
+            items[:] = self.__buffer(ordered, copy=False)
+        self.__modifications += 1
+        # records are compared as decoded instances, so they never use the binary search paths
+        self.__sorted = self.__layout is None and ((key is None and not reverse) or self.__element_count <= 1)
+
+    @property
+    def is_sorted(self) -> bool:
+        """ True while the Array is known to be in ascending order: after sort(), or when it was built from
+            ordered numbers, for as long as every later insert or assignment keeps the order.
+            Known-sorted Arrays answer in, index and count with a binary search.
+        """
+        return self.__sorted
+
+    def index(self, item: Any, start: int=0, stop: int | None=None) -> int:
+        """ Return the index of the first occurrence of item in [start, stop).
+
+        Raises:
+            ValueError: if item is not in that part of the Array.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__element_count)
+        items = self.__view()[start:stop]
+        if self.__sorted:
+            try:
+                position = self.__bisect(items, item, bisect_left, 'left')
+            except TypeError:
+                # an item that cannot be compared with the items is not in the Array, as with list.index
+                position = len(items)
+            if position < len(items) and items[position] == item:
+                return start + position
+        elif self.__is_native():
+            hits = np.flatnonzero(items == item) if isinstance(item, _SCALARS) else []
+            if len(hits):
+                return start + int(hits[0])
+        elif item in (found := self.__items(items)):
+            return start + found.index(item)
+        raise ValueError(f"{item!r} is not in the Array")
+
+    def count(self, item: Any) -> int:
+        """ Return the number of occurrences of item. """
+        if self.__sorted:
+            try:
+                return self.bisect_right(item) - self.bisect_left(item)
+            except TypeError:
+                return 0
+        if self.__is_native():
+            return int(np.count_nonzero(self.__view() == item)) if isinstance(item, _SCALARS) else 0
+        return self.__items(self.__view()).count(item)
+
+    def bisect_left(self, item: Any) -> int:
+        """ Return the leftmost index item could be inserted at while keeping a sorted Array sorted.
+            Like the bisect module, the result is only meaningful if the Array is in ascending order.
+        """
+        return self.__bisect(self.__view(), item, bisect_left, 'left')
+
+    def bisect_right(self, item: Any) -> int:
+        """ Return the rightmost index item could be inserted at while keeping a sorted Array sorted.
+            Like the bisect module, the result is only meaningful if the Array is in ascending order.
+        """
+        return self.__bisect(self.__view(), item, bisect_right, 'right')
+
+    def reserve(self, capacity: int) -> None:
+        """ Make room for at least capacity items without any further reallocation, and keep
+            the physical size from shrinking below capacity until shrink_to_fit is called.
+
+        Args:
+            capacity (int): the number of items the Array should be able to hold.
+
+        Raises:
+            ValueError: if capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("Capacity cannot be negative")
+        self.__reserved = capacity
+        if self.__capacity - self.__head < capacity:
+            self.__relocate(max(capacity, self.__element_count), 0)
+
+    def shrink_to_fit(self) -> None:
+        """ Release any reservation and reallocate the buffer so the physical size equals the logical size. """
+        self.__reserved = 0
+        if self.__capacity != self.__element_count:
+            self.__relocate(self.__element_count, 0)
+
+    @property
+    def capacity(self) -> int:
+        """ The physical size of the Array (the number of items it can hold before reallocating). """
+        return self.__capacity
+
+    @property
+    def growth_factor(self) -> float:
+        """ The factor the physical size is multiplied by when the Array runs out of room (default: 2). """
+        return self.__growth_factor
+
+    @growth_factor.setter
+    def growth_factor(self, growth_factor: float) -> None:
+        self.__check_resize_policy(growth_factor, self.__shrink_threshold)
+        self.__growth_factor = growth_factor
+
+    @property
+    def shrink_threshold(self) -> float:
+        """ The fraction of the physical size at or below which a removal shrinks the Array by the
+            growth factor (default: 0.25). Set to 0 to only shrink once the Array is empty.
+        """
+        return self.__shrink_threshold
+
+    @shrink_threshold.setter
+    def shrink_threshold(self, shrink_threshold: float) -> None:
+        self.__check_resize_policy(self.__growth_factor, shrink_threshold)
+        self.__shrink_threshold = shrink_threshold
 
     def pop(self) -> None:
-        self.__delitem__(-1)
+        if self.__element_count == 0:
+            raise IndexError("Cannot pop from an empty array")
+        self.__element_count -= 1
+        self.__modifications += 1
+        self.__vacate(self.__head + self.__element_count, self.__head + self.__element_count + 1)
+        self.__shrink(self.__element_count)
     
     def pop_front(self) -> None:
-        self.__delitem__(0)
+        if self.__element_count == 0:
+            raise IndexError("Cannot pop from an empty array")
+        self.__head += 1
+        self.__element_count -= 1
+        self.__modifications += 1
+        self.__vacate(self.__head - 1, self.__head)
+        self.__shrink(self.__element_count)
 
     def __len__(self) -> int: 
         return self.__element_count
@@ -111,32 +583,81 @@ class Array(IArray[T]):
             return False
         if len(other) != len(self):
             return False
-        for index in range(len(self)):
-            if self[index] != other[index]:
+        if self.__is_native() and other.__is_native():
+            return bool(np.array_equal(self.__view(), other.__view()))
+        for mine, theirs in zip(self, other):
+            if mine != theirs:
                 return False
         return True
     
     def __iter__(self) -> Iterator[T]:
-        return iter(self.__elements[0: self.__element_count])
+        return self.__walk(reverse=False)
 
     def __reversed__(self) -> Iterator[T]:
-        return iter(self[(self.__element_count-1):-1:-1])
+        return self.__walk(reverse=True)
+
+    def chunked(self, size: int) -> Iterator[Array[T]]:
+        """ Iterate over the Array in contiguous blocks of size items (the last block may be shorter), for
+            consumers that work a batch at a time. Each block is a copy-on-write slice of the Array, so no
+            items are copied unless the block or the Array is written to.
+
+        Examples:
+            >>> array = Array[int](starting_sequence=[0, 1, 2, 3, 4], data_type=int)
+            >>> print([list(block) for block in array.chunked(2)])
+            [[0, 1], [2, 3], [4]]
+
+        Args:
+            size (int): the number of items per block.
+
+        Returns:
+            blocks (Iterator[Array[T]]): the blocks, in order.
+
+        Raises:
+            ValueError: if size is less than 1.
+            RuntimeError: on the next block, if the Array changed length or order since iteration started.
+        """
+        if size < 1:
+            raise ValueError("Blocks must hold at least one item")
+        return self.__blocks(size)
 
     def __delitem__(self, index: int) -> None:
-        if not (-self.__element_count < index and index < self.__element_count):
+        if not (-self.__element_count <= index and index < self.__element_count):
             raise IndexError("Index out of bounds")
-        for i in range(index, self.__element_count - 1):
-            self.__elements[i] = self.__elements[i + 1]
-        self.__element_count -= 1
-        self.__shrink(self.__element_count)
+        if index < 0:
+            index += self.__element_count
+        self.delete_range(index, index + 1)
 
     def __contains__(self, item: Any) -> bool:
-        return item == any(self)
+        if self.__is_native():
+            if not isinstance(item, _SCALARS):
+                return False
+            if self.__sorted:
+                items = self.__view()
+                position = self.__bisect(items, item, bisect_left, 'left')
+                return position < len(items) and bool(items[position] == item)
+            return bool((self.__view() == item).any())
+        if self.__sorted:
+            try:
+                return self.index(item) >= 0
+            except (ValueError, TypeError):
+                return False
+        return item in self.__items(self.__view())
 
     def clear(self) -> None:
-        self.__elements = np.empty(0)
+        self.__modifications += 1
+        if self.__mapping is not None:
+            # keep the file, just forget its items
+            self.__element_count = 0
+            self.__head = 0
+            self.__sorted = self.__layout is None
+            return
+        self.__release()
+        self.__elements = np.empty(0, dtype=self.__dtype)
         self.__element_count = 0
         self.__capacity = 0
+        self.__head = 0
+        self.__reserved = 0
+        self.__sorted = self.__layout is None
 
     def __str__(self) -> str:
         return '[' + ', '.join(str(item) for item in self) + ']'
@@ -144,29 +665,382 @@ class Array(IArray[T]):
     def __repr__(self) -> str:
         return f'Array {self.__str__()}, Logical: {self.__element_count}, Physical: {self.__capacity}, type: {self.__data_type}'
     
-    def __grow(self, new_size: int) -> None:
-        if self.__capacity >= new_size:
+    # Element-wise arithmetic for bool, int and float Arrays. The other operand can be a number, a numeric Array
+    # or a numpy array of the same length. Each operator is a single numpy ufunc over the buffer and returns a
+    # new Array, and the in-place operators write the result straight into this Array's buffer.
+    def __add__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.add)
+
+    def __radd__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.add, reflected=True)
+
+    def __iadd__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.add)
+
+    def __sub__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.subtract)
+
+    def __rsub__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.subtract, reflected=True)
+
+    def __isub__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.subtract)
+
+    def __mul__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.multiply)
+
+    def __rmul__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.multiply, reflected=True)
+
+    def __imul__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.multiply)
+
+    def __truediv__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.true_divide)
+
+    def __rtruediv__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.true_divide, reflected=True)
+
+    def __itruediv__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.true_divide)
+
+    def __floordiv__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.floor_divide)
+
+    def __rfloordiv__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.floor_divide, reflected=True)
+
+    def __ifloordiv__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.floor_divide)
+
+    def __mod__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.remainder)
+
+    def __rmod__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.remainder, reflected=True)
+
+    def __imod__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.remainder)
+
+    def __pow__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.power)
+
+    def __rpow__(self, other: Any) -> Array[Any]:
+        return self.__arithmetic(other, np.power, reflected=True)
+
+    def __ipow__(self, other: Any) -> Array[T]:
+        return self.__in_place(other, np.power)
+
+    # <, <=, > and >= compare item by item and return bool Arrays that can be used as masks, array[array > 0].
+    # == and != keep comparing whole Arrays.
+    def __lt__(self, other: Any) -> Array[bool]:
+        return self.__arithmetic(other, np.less)
+
+    def __le__(self, other: Any) -> Array[bool]:
+        return self.__arithmetic(other, np.less_equal)
+
+    def __gt__(self, other: Any) -> Array[bool]:
+        return self.__arithmetic(other, np.greater)
+
+    def __ge__(self, other: Any) -> Array[bool]:
+        return self.__arithmetic(other, np.greater_equal)
+
+    def __array__(self, dtype: Any=None, copy: bool | None=None) -> NDArray:
+        # the logical items are exported as a view of the buffer, so np.asarray(array) is free and
+        # writes through it show up in the Array until it next reallocates
+        self.__detach()
+        items = self.__view()
+        if dtype is not None and np.dtype(dtype) != items.dtype:
+            if copy is False:
+                raise ValueError(f"Cannot export the Array as {dtype} without copying")
+            return items.astype(dtype)
+        if copy:
+            return items.copy()
+        self.__exported = True
+        return items
+
+    def __buffer__(self, flags: int) -> memoryview:
+        self.__detach()
+        self.__exported = True
+        return memoryview(self.__view())
+
+    def field(self, name: str) -> NDArray:
+        """ Return one field of a record Array (records=True) as a numpy view, for vectorized column work
+            such as array.field('price').sum(). Enum fields hold the position of each member in its Enum.
+            Writes through the view change the Array.
+
+        Args:
+            name (str): the name of a field of the dataclass.
+
+        Returns:
+            column (NDArray): the field of every item, in order.
+
+        Raises:
+            TypeError: if the Array does not store records.
+            KeyError: if the dataclass has no such field.
+        """
+        if self.__layout is None:
+            raise TypeError("Only record Arrays have fields")
+        if name not in self.__layout.names:
+            raise KeyError(name)
+        self.__detach()
+        return self.__view()[name]
+
+    def __copy__(self) -> Array[T]:
+        return self[:]
+
+    def __del__(self) -> None:
+        self.__shared[0] -= 1
+
+    def __walk(self, reverse: bool) -> Iterator[T]:
+        # converts the items to Python values one block at a time, so iterating never copies the whole Array.
+        # Each block is a snapshot taken when the iteration reaches it, so an assignment is only seen if it is
+        # made before its block is converted; any change of length or order raises.
+        modifications, count = self.__modifications, self.__element_count
+        for block in range(0, count, _ITERATION_BLOCK):
+            if reverse:
+                start, stop = max(count - block - _ITERATION_BLOCK, 0), count - block
+            else:
+                start, stop = block, min(block + _ITERATION_BLOCK, count)
+            items = self.__items(self.__view()[start:stop])
+            if reverse:
+                items.reverse()
+            for item in items:
+                if self.__modifications != modifications:
+                    raise RuntimeError("Array changed during iteration")
+                yield item
+
+    def __blocks(self, size: int) -> Iterator[Array[T]]:
+        modifications = self.__modifications
+        for start in range(0, self.__element_count, size):
+            if self.__modifications != modifications:
+                raise RuntimeError("Array changed during iteration")
+            yield self[start:min(start + size, self.__element_count)]
+
+    def __grow(self, new_size: int, front: bool = False) -> None:
+        extra = new_size - self.__element_count
+        back_room = self.__capacity - self.__head - self.__element_count
+        if (front and self.__head >= extra) or (not front and back_room >= extra):
             pass
+        elif new_size <= self.__capacity // 2:
+            # plenty of room overall, so re-centre the items instead of reallocating
+            slack = self.__capacity - new_size
+            self.__relocate(self.__capacity, slack // 2 + (extra if front else 0))
         else:
-            if self.__capacity == 0:
-                self.__capacity = 1
-                self.__elements = np.empty(self.__capacity, dtype=self.__data_type)
+            new_capacity = self.__capacity
+            while new_capacity < new_size:
+                new_capacity = max(int(new_capacity * self.__growth_factor), new_capacity + 1)
+            if front:
+                back_room = min(back_room, new_capacity - new_size)
+                self.__relocate(new_capacity, new_capacity - self.__element_count - back_room)
             else:
-                self.__capacity *= 2  
-                newarray = np.empty(self.__capacity, dtype = self.__data_type)
-                for i in range(self.__element_count):
-                    newarray[i] = self.__elements[i]
-                self.__elements = newarray
+                self.__relocate(new_capacity, min(self.__head, new_capacity - new_size))
 
     def __shrink(self, new_size: int) -> None:
-        if new_size > (self.__capacity / 4):
+        if self.__mapping is not None or new_size > (self.__capacity * self.__shrink_threshold):
+            # file-backed Arrays only give back disk space through shrink_to_fit
             pass
         else:
-            self.__capacity /= 2
-            newarray = np.empty(self.__capacity)
-            for i in range(self.__element_count):
-                newarray[i] = self.__elements[i]
-            self.__elements = newarray    
+            new_capacity = max(int(self.__capacity / self.__growth_factor), self.__reserved, self.__element_count)
+            if new_capacity < self.__capacity:
+                self.__relocate(new_capacity, (new_capacity - self.__element_count) // 2)
+
+    @staticmethod
+    def __check_resize_policy(growth_factor: float, shrink_threshold: float) -> None:
+        if growth_factor <= 1:
+            raise ValueError("Growth factor must be greater than 1")
+        if shrink_threshold < 0 or shrink_threshold * growth_factor >= 1:
+            raise ValueError("Shrink threshold must be at least 0 and less than 1 / growth factor")
+
+    def __relocate(self, new_capacity: int, new_head: int) -> None:
+        if self.__mapping is not None:
+            self.__relocate_mapped(new_capacity, new_head)
+            return
+        items = self.__view()
+        # recentring in place would move items under slices, exported views and borrowed ndarrays
+        if new_capacity == self.__capacity and self.__shared[0] == 1 and not self.__exported:
+            self.__elements[new_head:new_head + self.__element_count] = items
+        else:
+            newarray = np.empty(new_capacity, dtype = self.__dtype)
+            newarray[new_head:new_head + self.__element_count] = items
+            self.__elements = newarray
+            self.__release()
+        self.__capacity = new_capacity
+        self.__head = new_head
+
+    def __relocate_mapped(self, new_capacity: int, new_head: int) -> None:
+        # the file is the only buffer: grow it, move the items inside it, and only truncate it
+        # when no slice is still mapping its old end
+        if new_capacity < self.__capacity and self.__shared[0] > 1:
+            new_capacity = self.__capacity
+        if new_capacity > self.__capacity:
+            self.__elements = self.__mapping.resize(new_capacity)
+        self.__elements[new_head:new_head + self.__element_count] = self.__view()
+        if new_capacity < self.__capacity:
+            self.__elements = self.__mapping.resize(new_capacity)
+        self.__capacity = new_capacity
+        self.__head = new_head
+
+    def __view(self) -> NDArray:
+        return self.__elements[self.__head:self.__head + self.__element_count]
+
+    def __slice_view(self, buffer: NDArray) -> Array[T]:
+        # slices share the parent's buffer. Every Array sharing a buffer holds the same counter,
+        # and whichever side writes first while the counter is above 1 copies the buffer (__detach).
+        # Writes through an exported view bypass the counter, so slices of an exported buffer are copies
+        view = Array.__new__(Array)
+        if self.__exported and self.__mapping is None:
+            buffer = buffer.copy()
+            view.__shared = [1]
+        else:
+            view.__shared = self.__shared
+            view.__shared[0] += 1
+        view.__exported = False
+        view.__growth_factor = self.__growth_factor
+        view.__shrink_threshold = self.__shrink_threshold
+        view.__reserved = 0
+        view.__mapping = None
+        view.__layout = self.__layout
+        view.__data_type = self.__data_type
+        view.__dtype = self.__dtype
+        view.__elements = buffer
+        view.__element_count = view.__capacity = len(buffer)
+        view.__head = 0
+        view.__modifications = 0
+        return view
+
+    def __detach(self) -> None:
+        # a file-backed Array writes straight to its file, see memmap
+        if self.__shared[0] > 1 and self.__mapping is None:
+            self.__elements = self.__elements.copy()
+            self.__release()
+
+    def __vacate(self, start: int, stop: int) -> None:
+        # drop the references held by buffer slots that no longer hold items, unless a slice or an export can
+        # still see them
+        if self.__dtype.hasobject and self.__shared[0] == 1 and not self.__exported and start < stop:
+            self.__elements[start:stop] = None if self.__dtype == object else np.zeros(stop - start, dtype=self.__dtype)
+
+    def __release(self) -> None:
+        # the Array has moved to a buffer of its own, which nothing has exported yet
+        self.__shared[0] -= 1
+        self.__shared = [1]
+        self.__exported = False
+
+    def __bisect(self, items: NDArray, item: Any, search: Callable, side: str) -> int:
+        if self.__is_native():
+            return int(np.searchsorted(items, item, side=side))
+        return search(items, item)
+
+    def __in_order(self, items: NDArray) -> bool:
+        # only numbers are checked up front, object items would need a Python comparison per pair
+        if self.__layout is not None:
+            return False
+        if len(items) <= 1:
+            return True
+        return self.__is_native() and bool(np.all(items[:-1] <= items[1:]))
+
+    def __keeps_order(self, left: int, right: int, items: Sequence[T] | NDArray) -> bool:
+        # would the Array still be sorted with items placed between view[left - 1] and view[right]?
+        if not self.__sorted or len(items) == 0:
+            return self.__sorted
+        view = self.__view()
+        try:
+            if len(items) > 1 and not (self.__is_native() and self.__in_order(np.asarray(items))):
+                return False
+            if left > 0 and not view[left - 1] <= items[0]:
+                return False
+            return right >= len(view) or bool(items[-1] <= view[right])
+        except TypeError:
+            return False
+
+    def __parallel_items(self) -> NDArray | list[T]:
+        # native buffers go to the workers through shared memory, everything else as Python items
+        items = self.__view()
+        return items if self.__is_native() else self.__items(items)
+
+    def __operand(self, other: Any) -> Any:
+        # the value a ufunc is given for the other side of an operator, or NotImplemented
+        if not self.__is_native():
+            return NotImplemented
+        if isinstance(other, Array):
+            return other.__view() if other.__is_native() else NotImplemented
+        if isinstance(other, (*_SCALARS, np.ndarray)):
+            return other
+        return NotImplemented
+
+    def __arithmetic(self, other: Any, ufunc: np.ufunc, reflected: bool=False) -> Array[Any]:
+        operand = self.__operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        items = self.__view()
+        return Array.from_numpy(ufunc(operand, items) if reflected else ufunc(items, operand))
+
+    def __in_place(self, other: Any, ufunc: np.ufunc) -> Array[T]:
+        operand = self.__operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        self.__detach()
+        items = self.__view()
+        # results that do not fit the data type, like int /= 2, raise a TypeError instead of being truncated
+        ufunc(items, operand, out=items)
+        self.__sorted = self.__in_order(items)
+        return self
+
+    @staticmethod
+    def __is_mask(index: Any) -> bool:
+        if isinstance(index, Array):
+            return index.__dtype == bool
+        return isinstance(index, np.ndarray) and index.dtype == bool
+
+    def __is_native(self) -> bool:
+        return self.__dtype != object and self.__layout is None
+
+    def __encode(self, item: T) -> Any:
+        # records are encoded, and their fields checked, before anything about the Array changes
+        return item if self.__layout is None else self.__layout.encode(item)
+
+    def __items(self, items: NDArray) -> list[T]:
+        # the Python-level items of part of the buffer
+        return items.tolist() if self.__layout is None else self.__layout.decode_all(items)
+
+    def __buffer(self, sequence: Sequence[T] | NDArray, copy: bool) -> NDArray:
+        if self.__is_native():
+            return self.__native_buffer(sequence)
+        if self.__layout is not None:
+            return self.__record_buffer(sequence, copy)
+        return self.__object_buffer(sequence, copy)
+
+    def __is_valid(self, item: Any) -> bool:
+        if isinstance(item, self.__data_type):
+            return True
+        return self.__is_native() and isinstance(item, np.generic) and item.dtype.kind in _NATIVE_KINDS[self.__data_type]
+
+    def __native_buffer(self, sequence: Sequence[T] | NDArray) -> NDArray:
+        if len(sequence) == 0:
+            return np.empty(0, dtype=self.__dtype)
+        try:
+            buffer = np.asarray(sequence)
+        except ValueError:
+            raise TypeError("Items do not match the array data type")
+        if buffer.ndim != 1 or buffer.dtype.kind not in _NATIVE_KINDS[self.__data_type] \
+                or not np.can_cast(buffer.dtype, self.__dtype):
+            raise TypeError("Items do not match the array data type")
+        return buffer.astype(self.__dtype, copy=isinstance(sequence, np.ndarray))
+
+    def __object_buffer(self, sequence: Sequence[T] | NDArray, copy: bool) -> NDArray:
+        if not all(map(isinstance, sequence, repeat(self.__data_type))):
+            raise TypeError("Items do not match the array data type")
+        if copy:
+            sequence = deepcopy(list(sequence))
+        return np.fromiter(sequence, dtype=self.__dtype, count=len(sequence))
+
+    def __record_buffer(self, sequence: Sequence[T] | NDArray, copy: bool) -> NDArray:
+        if not all(map(isinstance, sequence, repeat(self.__data_type))):
+            raise TypeError("Items do not match the array data type")
+        if copy and self.__layout.holds_references:
+            sequence = deepcopy(list(sequence))
+        return self.__layout.encode_all(iter(sequence), len(sequence))
 
 
 if __name__ == '__main__':
@@ -1,69 +1,77 @@
 from __future__ import annotations
+from itertools import chain
+import numbers
 import os
-from typing import Iterator, Sequence
+from typing import Any, Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
 
-from datastructures.iarray import IArray
-from datastructures.array import Array
+from datastructures.array import Array, _NATIVE_DTYPES, _NATIVE_KINDS, _data_type_of
+from datastructures.gridfile import read_grid, write_grid
 from datastructures.iarray2d import IArray2D, T
 
+# np.pad modes for the boundary options of Array2D.convolve
+_PAD_MODES = {'zero': 'constant', 'wrap': 'wrap', 'reflect': 'symmetric'}
+# the 3x3 Moore neighbourhood without its centre, for Array2D.neighbor_sum
+_NEIGHBORS = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
+
 
 class Array2D(IArray2D[T]):
 
     class Row(IArray2D.IRow[T]):
-        def __init__(self, row_index: int, array: IArray, num_columns: int, data_type = object) -> None:
+        def __init__(self, row_index: int, array: NDArray, num_columns: int, data_type = object) -> None:
+            # array is the row's own view of the 2D buffer, so reads and writes need no offset arithmetic
             self.__datatype = data_type
             self.__num_columns = num_columns
             self.__row_index = row_index
             self.__elements = array
-            self.__offset = self.__num_columns * self.__row_index
 
         def __getitem__(self, column_index: int) -> T:
-            if isinstance(column_index, int):
-                if column_index > 0 and column_index >= self.__num_columns:
-                    raise IndexError("Index out of bounds")
-                elif column_index < 0 and column_index <= self.__num_columns:
+            if isinstance(column_index, numbers.Integral):
+                if not (-self.__num_columns <= column_index < self.__num_columns):
                     raise IndexError("Index out of bounds")
-                else:
-                    return self.__elements[self.__offset + column_index]
+                item = self.__elements[column_index]
+                return item.item() if isinstance(item, np.generic) else item
             elif isinstance(column_index, slice):
-                start = column_index.start
-                stop = column_index.stop
-                step = column_index.step
-                if start > 0 and start >= self.__num_columns:
-                    raise IndexError("Index out of bounds")
-                elif start < 0 and start <= -self.__num_columns:
-                    raise IndexError("Index out of bounds")
-                elif stop > 0 and stop >= num_columns:
-                    raise IndexError("Index out of bounds")
-                elif stop < 0 and stop <= -num_columns:
-                    raise IndexError("Index out of bounds")
-                else:
-                    return self.__elements[self.__offset + start:self.__offset + stop:step]
+                # a slice of a row is a view of the same items, not a copy
+                part = self.__elements[Array2D._check_slice(column_index, self.__num_columns)]
+                return Array2D.Row(row_index = self.__row_index, array = part, num_columns = len(part), data_type = self.__datatype)
             else:
                 raise TypeError
-        
-        def __setitem__(self, column_index: int, value: T) -> None:
-                if column_index > 0 and column_index >= self.__num_columns:
-                    raise IndexError("Index out of bounds")
-                elif column_index < 0 and column_index <= self.__num_columns:
-                    raise IndexError("Index out of bounds")
-                else:
-                    self.__elements[self.__num_columns * self.__row_index + column_index] = value
-        
+
+        def __setitem__(self, column_index: int | slice, value: T | Sequence[T]) -> None:
+            if isinstance(column_index, slice):
+                # one bulk copy of a sequence, or one item repeated, into the slice
+                part = Array2D._check_slice(column_index, self.__num_columns)
+                if isinstance(value, np.ndarray):
+                    Array2D._check_ndarray(value, self.__datatype, self.__elements.dtype)
+                elif not Array2D._is_item(value, self.__datatype):
+                    items = list(value)
+                    if not all(Array2D._is_item(item, self.__datatype) for item in items):
+                        raise TypeError("Item is wrong type")
+                    value = np.fromiter(items, dtype=self.__elements.dtype, count=len(items))
+                self.__elements[part] = value
+                return
+            if not (-self.__num_columns <= column_index < self.__num_columns):
+                raise IndexError("Index out of bounds")
+            if not isinstance(value, self.__datatype):
+                raise TypeError("Item is wrong type")
+            self.__elements[column_index] = value
+
         def __iter__(self) -> Iterator[T]:
-            return iter(self.__elements[self.__offset: self.__offset + self.__num_columns])
-        
+            return iter(self.__elements.tolist())
+
         def __reversed__(self) -> Iterator[T]:
-            return self.__elements[self.__offset: self.__offset + self.__num_columns].reversed()
+            return iter(self.__elements[::-1].tolist())
 
         def __len__(self) -> int:
             return self.__num_columns
-        
+
         def __str__(self) -> str:
-            return f"[{', '.join([str(self[column_index]) for column_index in range(self.__num_columns)])}]"
-        
+            return f"[{', '.join(str(item) for item in self)}]"
+
         def __repr__(self) -> str:
-            return f'Row {self.__row_index}: [{", ".join([str(self[column_index]) for column_index in range(self.__num_columns - 1)])}, {str(self[self.num_columns - 1])}]'
+            return f'Row {self.__row_index}: {str(self)}'
 
 
     def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object) -> None:
@@ -76,59 +84,588 @@ class Array2D(IArray2D[T]):
         if isinstance(starting_sequence, str): #silly exception because a one letter string is a sequence apparently
             raise ValueError("must be a sequence of sequences")
         self.__data_type = data_type
-        if self.__data_type == object:
-            self.__data_type = starting_sequence[0][0]
-        for row in starting_sequence:
-            for item in row:
-                if not isinstance(item, self.__data_type):
-                    raise ValueError("All items must be of the same type")
-        self.__num_columns = len(starting_sequence[0])
+        if self.__data_type == object and len(starting_sequence) and len(starting_sequence[0]):
+            self.__data_type = type(starting_sequence[0][0])
+        self.__num_rows = len(starting_sequence)
+        self.__num_columns = len(starting_sequence[0]) if self.__num_rows else 0
         for row in starting_sequence:
             if len(row) != self.__num_columns:
                 raise ValueError("must be a sequence of sequences with the same length")
-        self.__num_rows = len(starting_sequence)
-        initial_sequence = ["" for i in range(self.__num_columns*self.__num_rows)]
-        rowcount = 0
-        for row in starting_sequence:
-            itemcount = 0
-            for item in row:
-                initial_sequence[rowcount * self.__num_columns + itemcount] = item
-                itemcount += 1
-            rowcount += 1
-        self.__elements = Array(starting_sequence=initial_sequence, data_type=self.__data_type)
+        # Array validates and copies the items in one pass, and its buffer is reshaped in place into the rows
+        try:
+            items = Array.from_iterable(chain.from_iterable(starting_sequence), data_type=self.__data_type)
+        except TypeError:
+            raise ValueError("All items must be of the same type")
+        # the items are the top left (rows, columns) corner of a buffer that may have spare rows and columns
+        self.__buffer: NDArray = np.asarray(items).reshape(self.__num_rows, self.__num_columns)
+        self.__elements: NDArray = self.__buffer
+        self.__owned = True
+        self.__rows: list[Array2D.Row | None] = [None] * self.__num_rows
 
     @staticmethod
     def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
-        start_empty = [[data_type() for i in range(cols)] for i in range(rows)]
-        return Array2D(starting_sequence=start_empty, data_type=data_type)
+        Array2D.__check_shape(rows, cols)
+        return Array2D.__wrap(Array2D.__defaults(rows, cols, data_type), data_type, owned=True)
+
+    @staticmethod
+    def full(rows: int, cols: int, fill: T, data_type: type | None=None) -> Array2D[T]:
+        """ Creates a two-dimensional array with every cell set to fill, allocated in one shot.
+
+        Examples:
+            >>> print(Array2D.full(2, 3, 7))
+            [[7, 7, 7], [7, 7, 7]]
+
+        Args:
+            rows (int): The number of rows.
+            cols (int): The number of columns.
+            fill (T): The item every cell holds. Objects other than bool, int and float are not copied,
+                so every cell refers to the same object, as in [fill] * n.
+            data_type (type | None): The type of data that the array will hold (default: the type of fill).
+
+        Returns:
+            Array2D[T]: The filled two-dimensional array.
+
+        Raises:
+            TypeError: If fill is not of data_type.
+            ValueError: If rows or cols is negative.
+        """
+        data_type = type(fill) if data_type is None else data_type
+        if not isinstance(fill, data_type):
+            raise TypeError("Fill is the wrong type")
+        Array2D.__check_shape(rows, cols)
+        return Array2D.__wrap(np.full((rows, cols), fill, dtype=_NATIVE_DTYPES.get(data_type, object)), data_type, owned=True)
+
+    @staticmethod
+    def zeros(rows: int, cols: int, data_type: type=float) -> Array2D[T]:
+        """ Creates a two-dimensional array of zeros (or False) in one zeroed allocation.
+
+        Args:
+            rows (int): The number of rows.
+            cols (int): The number of columns.
+            data_type (type): bool, int or float (default: float).
+
+        Returns:
+            Array2D[T]: The zeroed two-dimensional array.
+
+        Raises:
+            ValueError: If data_type is not bool, int or float, or rows or cols is negative.
+        """
+        if data_type not in _NATIVE_DTYPES:
+            raise ValueError("Only bool, int and float arrays can be zeroed")
+        return Array2D.empty(rows, cols, data_type)
+
+    @staticmethod
+    def from_numpy(ndarray: NDArray, copy: bool=False) -> Array2D[Any]:
+        """ Wraps a two-dimensional numpy array in an Array2D without validating its items one by one.
+            The data type is taken from the dtype as in Array.from_numpy. The items are shared until the
+            Array2D changes shape, which moves them into a buffer of its own and leaves ndarray as it was.
+
+        Examples:
+            >>> values = np.arange(6).reshape(2, 3)
+            >>> array2d = Array2D.from_numpy(values)
+            >>> array2d[0, 0] = 10
+            >>> print(values[0, 0])
+            10
+
+        Args:
+            ndarray (NDArray): The numpy array to wrap.
+            copy (bool): Copy the items instead of sharing them (default: False). A copy is always made if
+                the dtype has to be converted.
+
+        Returns:
+            Array2D[Any]: A two-dimensional array holding the items of ndarray.
+
+        Raises:
+            ValueError: If ndarray is not a two-dimensional numpy array.
+        """
+        if not isinstance(ndarray, np.ndarray) or ndarray.ndim != 2:
+            raise ValueError("from_numpy needs a two-dimensional numpy array")
+        data_type = _data_type_of(ndarray.dtype)
+        return Array2D.__wrap(ndarray.astype(_NATIVE_DTYPES.get(data_type, object), copy=copy), data_type, owned=copy)
+
+    @staticmethod
+    def load(path: str | os.PathLike, data_type: type | None=None, mmap: bool=False, writable: bool=False) -> Array2D[Any]:
+        """ Reads an Array2D from a .npy, .csv or Game of Life .txt file (see gridfile), parsing the rows of text
+            files straight into a buffer of the final size. With mmap=True a .npy file is mapped read-only
+            rather than read: only the rows that are touched are loaded, and writing to a cell raises ValueError.
+            Adding writable=True maps it for writing, and writes go to the file until the Array2D changes shape.
+
+        Examples:
+            >>> board = Array2D.load('projects/project2/start.txt')
+            >>> print(len(board), len(board[0]), board.sum())
+            7 30 9
+
+        Args:
+            path (str | os.PathLike): The file, whose extension picks the format.
+            data_type (type | None): bool, int, float or str. Required for .csv; taken from the file for .npy
+                and bool for .txt when None (default: None).
+            mmap (bool): Memory-map a .npy file (default: False).
+            writable (bool): Map it so writes change the file (default: False).
+
+        Returns:
+            Array2D[Any]: The two-dimensional array read from the file.
+
+        Raises:
+            ValueError: If the file type is unknown or malformed, data_type does not fit it, mmap is set for a
+                text file, or writable is set without mmap.
+        """
+        if data_type is not None and data_type not in _NATIVE_DTYPES and data_type is not str:
+            raise ValueError("Only bool, int, float and str items can be loaded")
+        elements = read_grid(path, None if data_type is None else _NATIVE_DTYPES.get(data_type, object), mmap, writable)
+        return Array2D.from_numpy(elements) if data_type is None else Array2D.__wrap(elements, data_type, owned=not mmap)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """ Writes the items to a .npy, .csv or Game of Life .txt file, as picked by the extension of path.
+            .npy files hold bool, int and float items and .txt files bools; .csv files hold any items as text.
+
+        Raises:
+            ValueError: If the file type is unknown or cannot hold the items.
+        """
+        write_grid(path, self.__elements)
+
+    def __getitem__(self, index: int | slice | tuple[int | slice, int | slice]) -> Array2D.IRow[T] | Array2D[T] | T:
+        if isinstance(index, tuple):
+            row, column = index
+            if isinstance(row, numbers.Integral) and isinstance(column, numbers.Integral):
+                # array2d[row, column] reads the item straight from the buffer without going through a Row
+                item = self.__elements[self.__check_cell(index)]
+                return item.item() if isinstance(item, np.generic) else item
+            # array2d[r0:r1, c0:c1] is a window onto the same items, array2d[r, c0:c1] and array2d[r0:r1, c] are lines
+            return self.__view(self.__check_window(row, column), row if isinstance(row, numbers.Integral) else column)
+        if isinstance(index, slice):
+            return self.__view(self.__check_window(index, slice(None)), 0)
+        if not (-self.__num_rows <= index < self.__num_rows):
+            raise IndexError("Row index out of bounds")
+        if index < 0:
+            index += self.__num_rows
+        # rows are views of the buffer, so one Row per row index can be handed out again and again
+        row = self.__rows[index]
+        if row is None:
+            row = self.__rows[index] = Array2D.Row(row_index = index, array = self.__elements[index], num_columns = self.__num_columns, data_type = self.__data_type)
+        return row
+
+    def column(self, column_index: int) -> Array2D.IRow[T]:
+        """ Returns column column_index as a strided view of the buffer. It is indexed, assigned and iterated
+            like a row, and writes through it change the Array2D.
+
+        Args:
+            column_index (int): The index of the column.
+
+        Returns:
+            Array2D.IRow[T]: The column, from the first row to the last.
+
+        Raises:
+            IndexError: If column_index is out of bounds.
+        """
+        if not (-self.__num_columns <= column_index < self.__num_columns):
+            raise IndexError("Column index out of bounds")
+        if column_index < 0:
+            column_index += self.__num_columns
+        return Array2D.Row(row_index = column_index, array = self.__elements[:, column_index], num_columns = self.__num_rows, data_type = self.__data_type)
+
+    def iter_columns(self) -> Iterator[Array2D.IRow[T]]:
+        """ Returns an iterator over the columns, each a view as returned by column. """
+        for j in range(self.__num_columns):
+            yield self.column(j)
+
+    def transpose(self) -> Array2D[T]:
+        """ Returns the transpose as an Array2D that shares the buffer, so no items are copied and writes to
+            either one show up in the other.
+
+        Examples:
+            >>> array2d = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+            >>> print(array2d.T)
+            [[1, 4], [2, 5], [3, 6]]
+        """
+        return Array2D.__wrap(self.__elements.T, self.__data_type)
+
+    @property
+    def T(self) -> Array2D[T]:
+        """ The transpose, see transpose. """
+        return self.transpose()
+
+    @property
+    def data_type(self) -> type:
+        """ The type of data that the array holds. """
+        return self.__data_type
+
+    def sum(self, axis: int | None=None) -> T | Array[T]:
+        """ Returns the sum of all items, or with axis=0 the sum of each column and with axis=1 the sum of
+            each row. Numeric Array2Ds are reduced by numpy in a single vectorized pass.
+
+        Args:
+            axis (int | None): None for the whole Array2D, 0 for columns or 1 for rows (default: None).
+
+        Returns:
+            T | Array[T]: The sum, or an Array of sums for an axis.
+        """
+        return self.__reduce(np.sum, axis)
+
+    def min(self, axis: int | None=None) -> T | Array[T]:
+        """ Returns the smallest item, overall or per column (axis=0) or row (axis=1), like sum.
+
+        Raises:
+            ValueError: If the Array2D, or the rows or columns being reduced, are empty.
+        """
+        return self.__reduce(np.min, axis)
 
-    def __getitem__(self, row_index: int) -> Array2D.IRow[T]: 
-        if row_index > 0 and row_index > self.__num_rows:
+    def max(self, axis: int | None=None) -> T | Array[T]:
+        """ Returns the largest item, overall or per column (axis=0) or row (axis=1), like sum.
+
+        Raises:
+            ValueError: If the Array2D, or the rows or columns being reduced, are empty.
+        """
+        return self.__reduce(np.max, axis)
+
+    def convolve(self, kernel: Array2D[Any] | Sequence[Sequence[Any]] | NDArray, boundary: str='zero') -> Array2D[Any]:
+        """ Returns the convolution of the items with kernel, computed a whole grid at a time: every non-zero
+            weight of the kernel adds one shifted, weighted copy of the grid to the result, so the work is one
+            numpy operation per kernel cell instead of Python per cell. The kernel is centred on each cell and
+            flipped as in a true convolution, which makes no difference for symmetric kernels.
+
+        Examples:
+            >>> array2d = Array2D([[1, 2, 3], [4, 5, 6]], data_type=int)
+            >>> print(array2d.convolve([[0, 1, 0], [1, 1, 1], [0, 1, 0]]))
+            [[7, 11, 11], [10, 17, 14]]
+
+        Args:
+            kernel (Array2D[Any] | Sequence[Sequence[Any]] | NDArray): The bool, int or float weights, with an
+                odd number of rows and columns.
+            boundary (str): How cells beyond the edges are read: 'zero' as 0, 'wrap' from the opposite edge, or
+                'reflect' mirrored about the edge, the edge cells included (default: 'zero').
+
+        Returns:
+            Array2D[Any]: A new Array2D of the same shape, int for bool and int items and kernels, else float.
+
+        Raises:
+            TypeError: If the items are not bool, int or float.
+            ValueError: If the kernel is not a two-dimensional numeric grid with odd sides, or boundary is unknown.
+        """
+        if boundary not in _PAD_MODES:
+            raise ValueError("boundary must be 'zero', 'wrap' or 'reflect'")
+        if self.__elements.dtype == object:
+            raise TypeError("Only bool, int and float arrays can be convolved")
+        weights = np.asarray(kernel)
+        if weights.ndim != 2 or weights.dtype.kind not in 'bif' or weights.shape[0] % 2 == 0 or weights.shape[1] % 2 == 0:
+            raise ValueError("kernel must be a two-dimensional bool, int or float grid with an odd number of rows and columns")
+        dtype = np.result_type(self.__elements.dtype, weights.dtype, np.int64)
+        result = np.zeros((self.__num_rows, self.__num_columns), dtype=dtype)
+        if self.__num_rows and self.__num_columns:
+            half_height, half_width = weights.shape[0] // 2, weights.shape[1] // 2
+            padded = np.pad(self.__elements.astype(dtype), ((half_height, half_height), (half_width, half_width)), mode=_PAD_MODES[boundary])
+            for (i, j), weight in np.ndenumerate(weights[::-1, ::-1]):
+                if weight:
+                    result += weight * padded[i:i + self.__num_rows, j:j + self.__num_columns]
+        return Array2D.__wrap(result, _data_type_of(dtype), owned=True)
+
+    def neighbor_sum(self, boundary: str='zero') -> Array2D[Any]:
+        """ Returns the sum of the eight neighbours of every cell, e.g. the live neighbour counts of a bool
+            Game of Life grid, as an int (or float) Array2D. boundary is as in convolve.
+
+        Examples:
+            >>> array2d = Array2D([[True, False], [True, True]], data_type=bool)
+            >>> print(array2d.neighbor_sum())
+            [[2, 3], [2, 2]]
+        """
+        return self.convolve(_NEIGHBORS, boundary)
+
+    def append_row(self, row: Sequence[T]) -> None:
+        """ Appends a row after the last one. Rows are added into spare capacity, which doubles when it runs
+            out, so appending costs O(columns) amortized.
+
+        Args:
+            row (Sequence[T]): The items of the row. Its length sets the number of columns of a 0 x 0 array.
+
+        Raises:
+            ValueError: If the row does not have one item per column.
+            TypeError: If an item is not of the array's data type.
+        """
+        self.insert_row(self.__num_rows, row)
+
+    def insert_row(self, index: int, row: Sequence[T]) -> None:
+        """ Inserts a row before row index, moving the rows below it down by one.
+
+        Args:
+            index (int): The index the new row will have. len(array2d) appends.
+            row (Sequence[T]): The items of the row.
+
+        Raises:
+            IndexError: If index is out of bounds.
+            ValueError: If the row does not have one item per column.
+            TypeError: If an item is not of the array's data type.
+        """
+        if not (-self.__num_rows <= index <= self.__num_rows):
             raise IndexError("Row index out of bounds")
-        elif row_index < 0 and row_index < -self.__num_rows:
+        if index < 0:
+            index += self.__num_rows
+        rows, columns = self.__num_rows, self.__num_columns
+        items = self.__line(row, columns if rows or columns else None)
+        columns = len(items)
+        self.__reserve(rows + 1, columns)
+        self.__buffer[index + 1:rows + 1, :columns] = self.__buffer[index:rows, :columns]
+        self.__buffer[index, :columns] = items
+        self.__reshape(rows + 1, columns)
+
+    def append_column(self, column: Sequence[T]) -> None:
+        """ Appends a column after the last one, with one item per row. Columns are added into spare capacity,
+            which doubles when it runs out, so appending costs O(rows) amortized.
+
+        Args:
+            column (Sequence[T]): The items of the column, from the first row to the last. Its length sets the
+                number of rows of a 0 x 0 array.
+
+        Raises:
+            ValueError: If the column does not have one item per row.
+            TypeError: If an item is not of the array's data type.
+        """
+        rows, columns = self.__num_rows, self.__num_columns
+        items = self.__line(column, rows if rows or columns else None)
+        rows = len(items)
+        self.__reserve(rows, columns + 1)
+        self.__buffer[:rows, columns] = items
+        self.__reshape(rows, columns + 1)
+
+    def delete_row(self, index: int) -> None:
+        """ Deletes row index, moving the rows below it up by one. The capacity is kept for later growth.
+
+        Raises:
+            IndexError: If index is out of bounds.
+        """
+        if not (-self.__num_rows <= index < self.__num_rows):
             raise IndexError("Row index out of bounds")
-        else:
-            return Array2D.Row(row_index = row_index, array = self.__elements, num_columns = self.__num_columns, data_type = self.__data_type)
-        
-    
-    def __iter__(self) -> Iterator[Sequence[T]]: 
+        if index < 0:
+            index += self.__num_rows
+        rows, columns = self.__num_rows, self.__num_columns
+        self.__reserve(rows, columns)
+        self.__buffer[index:rows - 1, :columns] = self.__buffer[index + 1:rows, :columns]
+        self.__vacate(slice(rows - 1, rows), slice(0, columns))
+        self.__reshape(rows - 1, columns)
+
+    def delete_column(self, index: int) -> None:
+        """ Deletes column index, moving the columns after it left by one. The capacity is kept for later growth.
+
+        Raises:
+            IndexError: If index is out of bounds.
+        """
+        if not (-self.__num_columns <= index < self.__num_columns):
+            raise IndexError("Column index out of bounds")
+        if index < 0:
+            index += self.__num_columns
+        rows, columns = self.__num_rows, self.__num_columns
+        self.__reserve(rows, columns)
+        self.__buffer[:rows, index:columns - 1] = self.__buffer[:rows, index + 1:columns]
+        self.__vacate(slice(0, rows), slice(columns - 1, columns))
+        self.__reshape(rows, columns - 1)
+
+    def resize(self, rows: int, cols: int, fill: T | None=None) -> None:
+        """ Changes the shape to rows x cols. Items inside both shapes keep their place, and new cells are set
+            to fill, or to data_type() as in empty when no fill is given. Shrinking keeps the capacity.
+
+        Examples:
+            >>> array2d = Array2D([[1, 2], [3, 4]], data_type=int)
+            >>> array2d.resize(3, 1, fill=0)
+            >>> print(array2d)
+            [[1], [3], [0]]
+
+        Args:
+            rows (int): The new number of rows.
+            cols (int): The new number of columns.
+            fill (T | None): The item new cells hold (default: None, a new data_type() per cell).
+
+        Raises:
+            ValueError: If rows or cols is negative.
+            TypeError: If fill is not of the array's data type.
+        """
+        Array2D.__check_shape(rows, cols)
+        if fill is not None and not isinstance(fill, self.__data_type):
+            raise TypeError("Fill is the wrong type")
+        old_rows, old_columns = self.__num_rows, self.__num_columns
+        self.__reserve(rows, cols)
+        self.__vacate(slice(rows, old_rows), slice(0, old_columns))
+        self.__vacate(slice(0, old_rows), slice(cols, old_columns))
+        kept_rows = min(rows, old_rows)
+        for new_cells in ((slice(kept_rows, rows), slice(0, cols)), (slice(0, kept_rows), slice(old_columns, cols))):
+            shape = self.__buffer[new_cells].shape
+            if shape[0] and shape[1]:
+                self.__buffer[new_cells] = Array2D.__defaults(*shape, self.__data_type) if fill is None else fill
+        self.__reshape(rows, cols)
+
+    def __setitem__(self, index: tuple[int | slice, int | slice] | slice, value: T | Array2D[T] | NDArray) -> None:
+        if isinstance(index, slice):
+            index = (index, slice(None))
+        if not isinstance(index, tuple):
+            raise TypeError("Set items with array2d[row, column] or array2d[row][column]")
+        row, column = index
+        if isinstance(row, numbers.Integral) and isinstance(column, numbers.Integral):
+            if not isinstance(value, self.__data_type):
+                raise TypeError("Item is wrong type")
+            self.__elements[self.__check_cell(index)] = value
+            return
+        # a window is filled with one bulk copy of another Array2D or ndarray of its shape, or with one item
+        window = self.__check_window(row, column)
+        if isinstance(value, Array2D):
+            if not issubclass(value.__data_type, self.__data_type):
+                raise TypeError("Items are the wrong type")
+            value = value.__elements
+        elif isinstance(value, np.ndarray):
+            Array2D._check_ndarray(value, self.__data_type, self.__elements.dtype)
+        elif not isinstance(value, self.__data_type):
+            raise TypeError("Item is wrong type")
+        self.__elements[window] = value
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
         for i in range(self.__num_rows):
             yield self[i]
-    
+
     def __reversed__(self):
         for i in range(self.__num_rows-1, -1, -1):
             yield self[i]
-    
-    def __len__(self): 
+
+    def __len__(self):
         return self.__num_rows
-                                  
-    def __str__(self) -> str: 
+
+    def __str__(self) -> str:
         return f'[{", ".join(f"{str(row)}" for row in self)}]'
-    
-    def __repr__(self) -> str: 
+
+    def __repr__(self) -> str:
         return f'Array2D {self.__num_rows} Rows x {self.__num_columns} Columns, items: {str(self)}'
 
+    def __getstate__(self) -> dict[str, Any]:
+        # copy.deepcopy and pickle copy each ndarray on its own, which would cut the cached Rows and the
+        # items loose from the buffer, so only the items are kept and the views are rebuilt in __setstate__
+        state = self.__dict__.copy()
+        state['_Array2D__buffer'] = self.__elements
+        del state['_Array2D__elements'], state['_Array2D__rows']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__elements = self.__buffer
+        self.__owned = True
+        self.__rows = [None] * self.__num_rows
+
+    def __array__(self, dtype: Any=None, copy: bool | None=None) -> NDArray:
+        # the (rows, columns) buffer itself, so np.asarray(array2d) is free and writes through it show up
+        if dtype is not None and np.dtype(dtype) != self.__elements.dtype:
+            if copy is False:
+                raise ValueError(f"Cannot export the Array2D as {dtype} without copying")
+            return self.__elements.astype(dtype)
+        return self.__elements.copy() if copy else self.__elements
+
+    @staticmethod
+    def __wrap(elements: NDArray, data_type: type, owned: bool=False) -> Array2D[T]:
+        # an Array2D over an existing (rows, columns) ndarray, without copying or validating it. Unless the
+        # ndarray was made for it, the buffer is borrowed from a parent or a caller and must not be reshaped
+        array2d = Array2D.__new__(Array2D)
+        array2d.__data_type = data_type
+        array2d.__num_rows, array2d.__num_columns = elements.shape
+        array2d.__buffer = array2d.__elements = elements
+        array2d.__owned = owned
+        array2d.__rows = [None] * array2d.__num_rows
+        return array2d
+
+    def __reduce(self, reduction: Any, axis: int | None) -> T | Array[T]:
+        if axis not in (None, 0, 1):
+            raise ValueError("axis must be None, 0 or 1")
+        result = reduction(self.__elements, axis=axis)
+        if axis is None:
+            return result.item() if isinstance(result, np.generic) else result
+        return Array.from_numpy(result)
+
+    def __view(self, window: tuple[int | slice, int | slice], line_index: int) -> Array2D.IRow[T] | Array2D[T]:
+        view = self.__elements[window]
+        if view.ndim == 2:
+            return Array2D.__wrap(view, self.__data_type)
+        return Array2D.Row(row_index = line_index, array = view, num_columns = len(view), data_type = self.__data_type)
+
+    def __check_window(self, row: int | slice, column: int | slice) -> tuple[int | slice, int | slice]:
+        return Array2D._check_slice(row, self.__num_rows), Array2D._check_slice(column, self.__num_columns)
+
+    @staticmethod
+    def _check_slice(index: int | slice, length: int) -> int | slice:
+        # slice bounds follow Array: they may not lie outside the axis
+        if isinstance(index, numbers.Integral):
+            if not (-length <= index < length):
+                raise IndexError("Index out of bounds")
+        elif isinstance(index, slice):
+            for bound in (index.start, index.stop):
+                if bound is not None and not (-length <= bound <= length):
+                    raise IndexError("Index out of bounds")
+        else:
+            raise TypeError
+        return index
+
+    @staticmethod
+    def _is_item(item: Any, data_type: type) -> bool:
+        # as in Array, numpy scalars of a matching kind count as bool, int and float items
+        if isinstance(item, data_type):
+            return True
+        return data_type in _NATIVE_KINDS and isinstance(item, np.generic) and item.dtype.kind in _NATIVE_KINDS[data_type]
+
+    @staticmethod
+    def _check_ndarray(value: NDArray, data_type: type, dtype: np.dtype) -> None:
+        # a native buffer takes any ndarray that casts to its dtype, an object buffer checks every item
+        if dtype == object:
+            valid = all(isinstance(item, data_type) for item in value.flat)
+        else:
+            valid = np.can_cast(value.dtype, dtype, 'same_kind')
+        if not valid:
+            raise TypeError("Items are the wrong type")
+
+    @staticmethod
+    def __defaults(rows: int, cols: int, data_type: type) -> NDArray:
+        # rows x cols cells holding data_type(): a zeroed allocation for bool, int and float, and a fresh
+        # instance per cell for other types because they may be mutated in place (Grid's Cells are)
+        if data_type in _NATIVE_DTYPES:
+            return np.zeros((rows, cols), dtype=_NATIVE_DTYPES[data_type])
+        cells = np.fromiter((data_type() for _ in range(rows * cols)), dtype=object, count=rows * cols)
+        return cells.reshape(rows, cols)
+
+    def __line(self, line: Sequence[T], length: int | None) -> NDArray:
+        # the validated items of a new row or column
+        items = np.asarray(Array.from_iterable(line, data_type=self.__data_type))
+        if length is not None and len(items) != length:
+            raise ValueError(f"Expected {length} items, got {len(items)}")
+        return items
+
+    def __reserve(self, rows: int, cols: int) -> None:
+        # makes room for rows x cols items, at least doubling each dimension that runs out. Every shape change
+        # goes through here first: windows, transposes and from_numpy arrays borrow their buffer, so they move
+        # their items into a buffer of their own before anything is shifted or vacated
+        row_capacity, column_capacity = self.__buffer.shape
+        if self.__owned and rows <= row_capacity and cols <= column_capacity:
+            return
+        if rows > row_capacity:
+            row_capacity = max(rows, 2 * row_capacity)
+        if cols > column_capacity:
+            column_capacity = max(cols, 2 * column_capacity)
+        buffer = np.empty((row_capacity, column_capacity), dtype=self.__buffer.dtype)
+        buffer[:self.__num_rows, :self.__num_columns] = self.__elements
+        self.__buffer, self.__owned = buffer, True
+
+    def __vacate(self, rows: slice, cols: slice) -> None:
+        # drop references held by cells that are no longer part of the array
+        if self.__buffer.dtype == object:
+            self.__buffer[rows, cols] = None
+
+    def __reshape(self, rows: int, cols: int) -> None:
+        # Rows handed out earlier keep viewing the old shape, so the cache starts over
+        self.__num_rows, self.__num_columns = rows, cols
+        self.__elements = self.__buffer[:rows, :cols]
+        self.__rows = [None] * rows
+
+    @staticmethod
+    def __check_shape(rows: int, cols: int) -> None:
+        if rows < 0 or cols < 0:
+            raise ValueError("rows and cols cannot be negative")
+
+    def __check_cell(self, index: tuple[int, int]) -> tuple[int, int]:
+        row, column = index
+        if not (-self.__num_rows <= row < self.__num_rows and -self.__num_columns <= column < self.__num_columns):
+            raise IndexError("Index out of bounds")
+        return index
+
 
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
-    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
\ No newline at end of file
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
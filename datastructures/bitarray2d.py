@@ -0,0 +1,251 @@
+from __future__ import annotations
+import os
+from typing import Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array2d import Array2D
+from datastructures.iarray2d import IArray2D
+
+# cells per word of a BitArray2D
+_WORD_BITS = 64
+
+
+class BitArray2D(IArray2D[bool]):
+    """ A two-dimensional array of bools packed 64 cells to a uint64 word, one bit per cell, so a
+        100,000 x 100,000 board takes 1.25 GB. Each row is its own run of words and bit c of a row is bit c % 64
+        of word c // 64. Bits past the last column are always clear, so whole words can be counted and compared.
+
+        Rows combine a word at a time: &, | and ^ work cell by cell between two BitArray2Ds of the same shape,
+        ~ inverts every cell, and << n and >> n move every cell n columns towards the end or the start of its
+        row, filling the vacated columns with False.
+    """
+
+    class Row(IArray2D.IRow[bool]):
+        def __init__(self, row_index: int, array: BitArray2D, num_columns: int) -> None:
+            self.__row_index = row_index
+            self.__array = array
+            self.__num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> bool:
+            return self.__array[self.__row_index, column_index]
+
+        def __setitem__(self, column_index: int, value: bool) -> None:
+            self.__array[self.__row_index, column_index] = value
+
+        def __iter__(self) -> Iterator[bool]:
+            return iter(self.__array._dense_row(self.__row_index))
+
+        def __reversed__(self) -> Iterator[bool]:
+            return reversed(self.__array._dense_row(self.__row_index))
+
+        def __len__(self) -> int:
+            return self.__num_columns
+
+        def __str__(self) -> str:
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            return f'Row {self.__row_index}: {str(self)}'
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[bool]]=[[]], data_type=bool) -> None:
+        if data_type is not bool:
+            raise ValueError("A BitArray2D can only hold bools")
+        # Array2D validates the items, then they are packed
+        self.__pack(np.asarray(Array2D(starting_sequence, bool)))
+
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=bool) -> BitArray2D:
+        if data_type is not bool:
+            raise ValueError("A BitArray2D can only hold bools")
+        if rows < 0 or cols < 0:
+            raise ValueError("rows and cols cannot be negative")
+        return BitArray2D.__wrap(np.zeros((rows, -(-cols // _WORD_BITS)), dtype=np.uint64), cols)
+
+    @staticmethod
+    def from_dense(array2d: Array2D[bool]) -> BitArray2D:
+        """ Packs a bool Array2D, eight cells per byte in one vectorized pass.
+
+        Args:
+            array2d (Array2D[bool]): The dense array.
+
+        Returns:
+            BitArray2D: The packed array.
+
+        Raises:
+            TypeError: If array2d does not hold bools.
+        """
+        if array2d.data_type is not bool:
+            raise TypeError("Only bool arrays can be packed")
+        array = BitArray2D.__new__(BitArray2D)
+        array.__pack(np.asarray(array2d))
+        return array
+
+    def to_dense(self) -> Array2D[bool]:
+        """ Returns the cells unpacked into a bool Array2D. """
+        return Array2D.from_numpy(self.__unpack(self.__words))
+
+    def popcount(self) -> int:
+        """ Returns the number of True cells, counted a word at a time. """
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(self.__words).sum())
+        # numpy before 2.0 has no bitwise_count, so the bytes of the words are unpacked instead
+        return int(np.unpackbits(np.ascontiguousarray(self.__words).view(np.uint8)).sum())
+
+    @property
+    def words(self) -> NDArray:
+        """ The (rows, words per row) uint64 array of packed cells. Writes through it change the array, and must
+            leave the bits past the last column clear.
+        """
+        return self.__words
+
+    def __getitem__(self, index: int | tuple[int, int]) -> BitArray2D.Row | bool:
+        if isinstance(index, tuple):
+            row, column = self.__check_cell(index)
+            return bool((int(self.__words[row, column // _WORD_BITS]) >> (column % _WORD_BITS)) & 1)
+        if not (-self.__num_rows <= index < self.__num_rows):
+            raise IndexError("Row index out of bounds")
+        if index < 0:
+            index += self.__num_rows
+        return BitArray2D.Row(index, self, self.__num_columns)
+
+    def __setitem__(self, index: tuple[int, int], value: bool) -> None:
+        if not isinstance(index, tuple):
+            raise TypeError("Set items with array2d[row, column] or array2d[row][column]")
+        if not isinstance(value, bool):
+            raise TypeError("Item is wrong type")
+        row, column = self.__check_cell(index)
+        bit = np.uint64(1 << (column % _WORD_BITS))
+        if value:
+            self.__words[row, column // _WORD_BITS] |= bit
+        else:
+            self.__words[row, column // _WORD_BITS] &= ~bit
+
+    def __and__(self, other: BitArray2D) -> BitArray2D:
+        return BitArray2D.__wrap(self.__words & self.__other_words(other), self.__num_columns)
+
+    def __or__(self, other: BitArray2D) -> BitArray2D:
+        return BitArray2D.__wrap(self.__words | self.__other_words(other), self.__num_columns)
+
+    def __xor__(self, other: BitArray2D) -> BitArray2D:
+        return BitArray2D.__wrap(self.__words ^ self.__other_words(other), self.__num_columns)
+
+    def __iand__(self, other: BitArray2D) -> BitArray2D:
+        self.__words &= self.__other_words(other)
+        return self
+
+    def __ior__(self, other: BitArray2D) -> BitArray2D:
+        self.__words |= self.__other_words(other)
+        return self
+
+    def __ixor__(self, other: BitArray2D) -> BitArray2D:
+        self.__words ^= self.__other_words(other)
+        return self
+
+    def __invert__(self) -> BitArray2D:
+        inverted = BitArray2D.__wrap(~self.__words, self.__num_columns)
+        inverted.__clear_padding()
+        return inverted
+
+    def __lshift__(self, count: int) -> BitArray2D:
+        return self.__shift(count, towards_end=True)
+
+    def __rshift__(self, count: int) -> BitArray2D:
+        return self.__shift(count, towards_end=False)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitArray2D):
+            return False
+        return self.__shape() == other.__shape() and bool(np.array_equal(self.__words, other.__words))
+
+    def __iter__(self) -> Iterator[Sequence[bool]]:
+        for i in range(self.__num_rows):
+            yield self[i]
+
+    def __reversed__(self) -> Iterator[Sequence[bool]]:
+        for i in range(self.__num_rows - 1, -1, -1):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return self.__num_rows
+
+    def __str__(self) -> str:
+        return f'[{", ".join(f"{str(row)}" for row in self)}]'
+
+    def __repr__(self) -> str:
+        return f'BitArray2D {self.__num_rows} Rows x {self.__num_columns} Columns, {self.popcount()} set'
+
+    def _dense_row(self, row: int) -> list[bool]:
+        # every cell of one row, unpacked, for Row
+        return self.__unpack(self.__words[row:row + 1])[0].tolist()
+
+    @staticmethod
+    def __wrap(words: NDArray, num_columns: int) -> BitArray2D:
+        array = BitArray2D.__new__(BitArray2D)
+        array.__words = words
+        array.__num_rows, array.__num_columns = words.shape[0], num_columns
+        return array
+
+    def __pack(self, elements: NDArray) -> None:
+        self.__num_rows, self.__num_columns = elements.shape
+        num_words = -(-self.__num_columns // _WORD_BITS)
+        packed = np.zeros((self.__num_rows, num_words * 8), dtype=np.uint8)
+        packed[:, :-(-self.__num_columns // 8)] = np.packbits(elements, axis=1, bitorder='little')
+        # little-endian words keep bit c of the row at bit c % 64 of word c // 64
+        self.__words = packed.view('<u8').astype(np.uint64)
+
+    def __unpack(self, words: NDArray) -> NDArray:
+        packed = words.astype('<u8').view(np.uint8)
+        return np.unpackbits(packed, axis=1, count=self.__num_columns, bitorder='little').astype(bool)
+
+    def __shift(self, count: int, towards_end: bool) -> BitArray2D:
+        if count < 0:
+            raise ValueError("negative shift count")
+        num_words = self.__words.shape[1]
+        skipped, bits = divmod(count, _WORD_BITS)
+        shifted = np.zeros_like(self.__words)
+        if skipped < num_words:
+            if towards_end:
+                shifted[:, skipped:] = self.__words[:, :num_words - skipped]
+            else:
+                shifted[:, :num_words - skipped] = self.__words[:, skipped:]
+        if bits:
+            # the bits pushed out of one word carry into its neighbour
+            if towards_end:
+                carry = shifted[:, :-1] >> np.uint64(_WORD_BITS - bits)
+                shifted <<= np.uint64(bits)
+                shifted[:, 1:] |= carry
+            else:
+                carry = shifted[:, 1:] << np.uint64(_WORD_BITS - bits)
+                shifted >>= np.uint64(bits)
+                shifted[:, :-1] |= carry
+        result = BitArray2D.__wrap(shifted, self.__num_columns)
+        result.__clear_padding()
+        return result
+
+    def __clear_padding(self) -> None:
+        used = self.__num_columns % _WORD_BITS
+        if used:
+            self.__words[:, -1] &= np.uint64((1 << used) - 1)
+
+    def __other_words(self, other: BitArray2D) -> NDArray:
+        if not isinstance(other, BitArray2D):
+            raise TypeError("Bitwise operations need another BitArray2D")
+        if self.__shape() != other.__shape():
+            raise ValueError("Both BitArray2Ds must have the same number of rows and columns")
+        return other.__words
+
+    def __shape(self) -> tuple[int, int]:
+        return self.__num_rows, self.__num_columns
+
+    def __check_cell(self, index: tuple[int, int]) -> tuple[int, int]:
+        row, column = index
+        if not (-self.__num_rows <= row < self.__num_rows and -self.__num_columns <= column < self.__num_columns):
+            raise IndexError("Index out of bounds")
+        return row % self.__num_rows, column % self.__num_columns
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,142 @@
+""" Reads and writes the items of a two-dimensional array as .npy, .csv or the Game of Life text format, chosen
+    by the file extension. Text files are read twice: once to count the rows, then again to parse each row
+    straight into a buffer allocated at its final size, so no nested Python lists are built.
+
+    The Game of Life format (.txt) is the one of projects/project2/start.txt: lines starting with '#' are
+    comments, the first two other lines are the number of rows and columns, and each following line is a row
+    where 'X' is a live (True) cell and any other character a dead one.
+"""
+
+import csv
+import os
+from typing import Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+# the cells of a .txt grid, and the strings read as True and False from a .csv
+ALIVE, DEAD = 'X', '-'
+TRUE_STRINGS = ('True', 'true', '1')
+FALSE_STRINGS = ('False', 'false', '0')
+
+
+def read_grid(path: str | os.PathLike, dtype: np.dtype | None = None, mmap: bool = False,
+              writable: bool = False) -> NDArray:
+    ''' Reads the (rows, columns) items of the file at path.
+
+        Arguments:
+            path: The .npy, .csv or .txt file
+            dtype: The dtype of the items. Taken from the file for .npy and bool for .txt when None; required
+                for .csv, where the object dtype keeps each field as a str
+            mmap: Map a .npy file read-only instead of reading it, so only the rows that are touched are loaded
+            writable: Map the file for writing instead, so writes to the items change the file
+
+        Raises:
+            ValueError: If the extension is unknown, the file is malformed, dtype does not fit the file, mmap
+                is set for a text file, or writable is set without mmap
+    '''
+    extension = _extension(path)
+    if writable and not mmap:
+        raise ValueError("Only memory-mapped files can be opened for writing")
+    if mmap and extension != '.npy':
+        raise ValueError("Only .npy files can be memory-mapped")
+    if extension == '.npy':
+        elements = np.load(path, mmap_mode=('r+' if writable else 'r') if mmap else None, allow_pickle=False)
+        if elements.ndim != 2:
+            raise ValueError(f"{os.fspath(path)} does not hold a two-dimensional array")
+        if dtype is not None and np.dtype(dtype) != elements.dtype:
+            raise ValueError(f"{os.fspath(path)} holds {elements.dtype} items, not {np.dtype(dtype)}")
+        return elements
+    if extension == '.csv':
+        if dtype is None:
+            raise ValueError("A data type is needed to read a .csv file")
+        return _read_csv(path, np.dtype(dtype))
+    if dtype is not None and np.dtype(dtype) != np.bool_:
+        raise ValueError("Game of Life .txt files hold bool cells")
+    return _read_life(path)
+
+
+def write_grid(path: str | os.PathLike, elements: NDArray) -> None:
+    ''' Writes the (rows, columns) items to the file at path, in the format of its extension.
+
+        Raises:
+            ValueError: If the extension is unknown, or the items do not fit the format (.npy holds bool, int
+                and float items, .txt only bools)
+    '''
+    extension = _extension(path)
+    if extension == '.npy':
+        if elements.dtype == object:
+            raise ValueError("Only bool, int and float arrays can be saved as .npy")
+        np.save(path, elements, allow_pickle=False)
+    elif extension == '.csv':
+        with open(path, 'w', newline='') as file:
+            csv.writer(file).writerows(row.tolist() for row in elements)
+    else:
+        if elements.dtype != np.bool_:
+            raise ValueError("Only bool arrays can be saved as Game of Life .txt files")
+        rows, cols = elements.shape
+        characters = np.where(elements, np.uint8(ord(ALIVE)), np.uint8(ord(DEAD)))
+        with open(path, 'w') as file:
+            file.write(f"# Rows, columns, then one line per row with {ALIVE} for live cells.\n{rows}\n{cols}\n")
+            for row in characters:
+                file.write(row.tobytes().decode('ascii') + '\n')
+
+
+def _extension(path: str | os.PathLike) -> str:
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension not in ('.npy', '.csv', '.txt'):
+        raise ValueError(f"Unknown grid file type {extension!r}, expected .npy, .csv or .txt")
+    return extension
+
+
+def _csv_rows(path: str | os.PathLike) -> Iterator[list[str]]:
+    with open(path, newline='') as file:
+        for row in csv.reader(file):
+            if row:
+                yield row
+
+
+def _read_csv(path: str | os.PathLike, dtype: np.dtype) -> NDArray:
+    num_rows = sum(1 for _ in _csv_rows(path))
+    elements: NDArray | None = None
+    for i, row in enumerate(_csv_rows(path)):
+        if elements is None:
+            elements = np.empty((num_rows, len(row)), dtype=dtype)
+        if len(row) != elements.shape[1]:
+            raise ValueError(f"Row {i} of {os.fspath(path)} has {len(row)} fields, not {elements.shape[1]}")
+        try:
+            # numpy parses int and float fields itself
+            elements[i] = [_parse_bool(field) for field in row] if dtype == np.bool_ else row
+        except ValueError:
+            raise ValueError(f"Row {i} of {os.fspath(path)} does not hold {dtype} items") from None
+    return np.empty((0, 0), dtype=dtype) if elements is None else elements
+
+
+def _parse_bool(field: str) -> bool:
+    if field in TRUE_STRINGS:
+        return True
+    if field in FALSE_STRINGS:
+        return False
+    raise ValueError(f"{field!r} is not a bool")
+
+
+def _read_life(path: str | os.PathLike) -> NDArray:
+    with open(path) as file:
+        lines = (line.rstrip('\r\n') for line in file if not line.startswith('#'))
+        try:
+            num_rows, num_cols = int(next(lines)), int(next(lines))
+        except (StopIteration, ValueError):
+            raise ValueError(f"{os.fspath(path)} must start with the number of rows and columns") from None
+        elements = np.zeros((num_rows, num_cols), dtype=bool)
+        alive, count = ord(ALIVE), 0
+        for line in lines:
+            if count == num_rows:
+                if line.strip():
+                    raise ValueError(f"{os.fspath(path)} has more than {num_rows} rows")
+                continue
+            cells = np.frombuffer(line[:num_cols].encode('ascii', 'replace'), dtype=np.uint8)
+            elements[count, :len(cells)] = cells == alive
+            count += 1
+    if count < num_rows:
+        raise ValueError(f"{os.fspath(path)} has {count} rows, not {num_rows}")
+    return elements
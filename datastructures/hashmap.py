@@ -1,4 +1,5 @@
 import copy
+from functools import partial
 from typing import Callable, Iterator, Optional, Tuple
 from datastructures.ihashmap import KT, VT, IHashMap
 from datastructures.array import Array
@@ -11,15 +12,21 @@ from datastructures.linkedlist import LinkedList
 class HashMap(IHashMap[KT, VT]):
 
     def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None) -> None:
-        self._buckets = Array(starting_sequence = \
-        [LinkedList(data_type=tuple) for _ in range(number_of_buckets)], \
-        data_type = LinkedList)
+        # each bucket holds (hash, key, value) entries, so a key is hashed once per lookup and never on resize
+        self._buckets = self._new_buckets(number_of_buckets)
         self._count = 0
         self._load_factor_threshold = load_factor
         self._hash_function = custom_hash_function or self._default_hash_function
 
-    def _get_bucket_number(self, key: KT) -> int:
-        return self._hash_function(key) % len(self._buckets)
+    @staticmethod
+    def _new_buckets(number_of_buckets: int) -> Array:
+        # the buckets are brand new, so there is nothing to gain from deep copying them
+        return Array.from_iterable((LinkedList(data_type=tuple) for _ in range(number_of_buckets)), \
+        data_type = LinkedList, copy = False)
+
+    def _locate(self, key: KT) -> Tuple[int, LinkedList]:
+        key_hash = self._hash_function(key)
+        return key_hash, self._buckets[key_hash % len(self._buckets)]
 
     def _get_next_size(self) -> int:
 
@@ -37,63 +44,61 @@ class HashMap(IHashMap[KT, VT]):
         return size
     
     def _rehash_and_resize(self, new_size) -> None:
-        new_array = Array(starting_sequence = \
-        [LinkedList(data_type=tuple) for _ in range(new_size)], \
-        data_type = LinkedList)
+        new_array = self._new_buckets(new_size)
         for bucket in self._buckets:
-            for (k, v) in bucket:
-                bucketnumber = self._hash_function(k) % new_size
-                new_array[bucketnumber].append((k, v))
+            for entry in bucket:
+                new_array[entry[0] % new_size].append(entry)
         self._buckets = new_array
 
     def __getitem__(self, key: KT) -> VT:
-        bucketnumber = self._get_bucket_number(key)
-        for (k, v) in self._buckets[bucketnumber]:
-            if k == key:
+        key_hash, bucket = self._locate(key)
+        for (h, k, v) in bucket:
+            # comparing the cached hashes first skips the slower key comparisons
+            if h == key_hash and k == key:
                 return v
         raise KeyError("No such key can be found in this plane of existence.")
 
     def __setitem__(self, key: KT, value: VT) -> None:        
-        bucketnumber = self._get_bucket_number(key)
-        for pair in self._buckets[bucketnumber]:
-            if pair[0] == key:
-                self._buckets[bucketnumber].remove(pair)
+        key_hash, bucket = self._locate(key)
+        for entry in bucket:
+            if entry[0] == key_hash and entry[1] == key:
+                bucket.remove(entry)
                 self._count -= 1
                 break
-        self._buckets[bucketnumber].append((key, value))
+        bucket.append((key_hash, key, value))
         self._count += 1
         if self._count > len(self._buckets) * self._load_factor_threshold:
             self._rehash_and_resize(self._get_next_size())
 
     def keys(self) -> Iterator[KT]:
         for bucket in self._buckets:
-            for (k, v) in bucket:
+            for (h, k, v) in bucket:
                 yield k
     
     def values(self) -> Iterator[VT]:
         for bucket in self._buckets:
-            for (k, v) in bucket:
+            for (h, k, v) in bucket:
                 yield v
 
     def items(self) -> Iterator[Tuple[KT, VT]]:
         for bucket in self._buckets:
-            for (k, v) in bucket:
+            for (h, k, v) in bucket:
                 yield (k, v)
             
     def __delitem__(self, key: KT) -> None:
-        bucketnumber = self._get_bucket_number(key)
-        for pair in self._buckets[bucketnumber]:
-            if pair[0] == key:
-                self._buckets[bucketnumber].remove(pair)
+        key_hash, bucket = self._locate(key)
+        for entry in bucket:
+            if entry[0] == key_hash and entry[1] == key:
+                bucket.remove(entry)
                 self._count -= 1
                 return None
         raise KeyError("No such key can be found in this plane of existence.")
 
     
     def __contains__(self, key: KT) -> bool:
-        bucketnumber = self._get_bucket_number(key)
-        for (k, v) in self._buckets[bucketnumber]:
-            if k == key:
+        key_hash, bucket = self._locate(key)
+        for (h, k, v) in bucket:
+            if h == key_hash and k == key:
                 return True
         return False
     
@@ -123,12 +128,10 @@ class HashMap(IHashMap[KT, VT]):
     def _default_hash_function(key: KT) -> int:
         """
         Default hash function for the HashMap.
-        Uses Pickle to serialize the key and then hashes it using SHA-256. 
-        Uses pickle for serialization (to capture full object structure).
-        Falls back to repr() if the object is not pickleable (e.g., open file handles, certain C extensions).
-        Returns a consistent integer hash.
-        Warning: This method is not suitable
-        for keys that are not hashable or have mutable state.
+        Uses Python's built-in hash(), which is fast (str and bytes cache theirs), and keys that compare
+        equal (like 1 and 1.0) share a bucket. Unhashable keys such as lists fall back to stable_hash_function.
+        hash() of str and bytes keys changes between processes (see PYTHONHASHSEED); use
+        stable_hash_function() for bucket layouts that must be the same in every process.
 
         Args:
             key (KT): The key to hash.
@@ -136,7 +139,32 @@ class HashMap(IHashMap[KT, VT]):
             int: The hash value of the key.
         """
         try:
-            key_bytes = pickle.dumps(key)
+            return hash(key)
+        except TypeError:
+            return HashMap._stable_hash(key, b'')
+
+    @staticmethod
+    def stable_hash_function(seed: int = 0) -> Callable[[KT], int]:
+        """
+        Returns a hash function, for custom_hash_function, that gives the same value for a key in every
+        process and Python run. It serializes the key with pickle (falling back to repr() for keys that
+        cannot be pickled) and hashes the bytes with BLAKE2b keyed by seed, so different seeds give
+        unrelated bucket layouts. It is much slower than the default hash function, and keys must pickle
+        to the same bytes whenever they compare equal.
+
+        Args:
+            seed (int): The seed of the hash (default: 0).
+        Returns:
+            Callable[[KT], int]: The seeded hash function.
+        """
+        seed_bytes = seed.to_bytes(16, 'little', signed=True)
+        return partial(HashMap._stable_hash, seed_bytes=seed_bytes)
+
+    @staticmethod
+    def _stable_hash(key: KT, seed_bytes: bytes) -> int:
+        try:
+            # a fixed protocol keeps the bytes, and so the hash, the same across Python versions
+            key_bytes = pickle.dumps(key, protocol=4)
         except Exception:
             key_bytes = repr(key).encode()
-        return int(hashlib.md5(key_bytes).hexdigest(), 16)
\ No newline at end of file
+        return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8, key=seed_bytes).digest(), 'little')
@@ -0,0 +1,91 @@
+import os
+import struct
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class MappedFile:
+    """ The file behind a memory-mapped Array. The file starts with a fixed-size header that records the
+        dtype, logical length, capacity and head offset of the Array, followed by capacity items of that dtype.
+        The items are mapped with np.memmap so only the pages that are touched are read from disk.
+    """
+
+    MAGIC = b'NPARRAY1'
+    HEADER = struct.Struct('<8s8sqqq')    # magic, dtype string, length, capacity, head
+    HEADER_SIZE = 64                      # keeps the items 64-byte aligned
+
+    def __init__(self, path: str | os.PathLike, dtype: np.dtype | None = None, readonly: bool = False) -> None:
+        ''' Opens the file at path, creating an empty one if it does not exist yet.
+
+            Arguments:
+                path: The file to map
+                dtype: The dtype of the items. Required to create a file, checked against the header otherwise
+                readonly: Map the file read-only
+
+            Raises:
+                FileNotFoundError: If the file does not exist and readonly is set
+                ValueError: If the file is not an Array file, or dtype does not match it
+        '''
+        self.path = os.fspath(path)
+        self.readonly = readonly
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as file:
+                header = file.read(self.HEADER.size)
+            if len(header) != self.HEADER.size or header[:8] != self.MAGIC:
+                raise ValueError(f"{self.path} is not a memory-mapped Array file")
+            _, dtype_string, self.length, self.capacity, self.head = self.HEADER.unpack(header)
+            self.dtype = np.dtype(dtype_string.rstrip(b'\0').decode())
+            if dtype is not None and np.dtype(dtype) != self.dtype:
+                raise ValueError(f"{self.path} holds {self.dtype} items, not {np.dtype(dtype)}")
+        else:
+            if readonly:
+                raise FileNotFoundError(self.path)
+            if dtype is None:
+                raise ValueError("A dtype is needed to create a memory-mapped Array file")
+            self.dtype = np.dtype(dtype)
+            self.length = self.capacity = self.head = 0
+            with open(self.path, 'wb') as file:
+                file.truncate(self.HEADER_SIZE)
+            self.write_header(0, 0)
+        self.buffer = self.__map()
+
+    def resize(self, capacity: int) -> NDArray:
+        ''' Grows or truncates the file to hold capacity items and returns the new mapping of the items.
+            Items that fit in both the old and new capacity keep their place in the file.
+        '''
+        if self.readonly:
+            raise ValueError(f"{self.path} is opened read-only")
+        self.flush_items()
+        with open(self.path, 'r+b') as file:
+            file.truncate(self.HEADER_SIZE + capacity * self.dtype.itemsize)
+        self.capacity = capacity
+        self.buffer = self.__map()
+        return self.buffer
+
+    def write_header(self, length: int, head: int) -> None:
+        ''' Records the logical length and head offset of the Array, along with the current capacity. '''
+        self.length, self.head = length, head
+        header = self.HEADER.pack(self.MAGIC, self.dtype.str.encode(), length, self.capacity, head)
+        with open(self.path, 'r+b') as file:
+            file.write(header)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def flush(self, length: int, head: int) -> None:
+        ''' Writes the items and the header to disk. '''
+        if self.readonly:
+            return
+        self.flush_items()
+        self.write_header(length, head)
+
+    def flush_items(self) -> None:
+        if isinstance(self.buffer, np.memmap):
+            self.buffer.flush()
+
+    def __map(self) -> NDArray:
+        if self.capacity == 0:
+            # np.memmap cannot map zero bytes
+            return np.empty(0, dtype=self.dtype)
+        return np.memmap(self.path, dtype=self.dtype, mode='r' if self.readonly else 'r+',
+                         offset=self.HEADER_SIZE, shape=(self.capacity,))
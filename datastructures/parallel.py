@@ -0,0 +1,133 @@
+""" Runs a per-item function over the items of an Array, or a per-tile function over the tiles of a
+    TiledArray2D, in a pool of worker processes. The work is cut into a few chunks per worker. bool, int and
+    float buffers are copied once into shared memory, and each worker reads its chunk from there, so only the
+    chunk bounds are pickled. Object items are pickled chunk by chunk. The function, and reduce's combining
+    function, must be picklable, i.e. defined at the top level of a module.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from multiprocessing.shared_memory import SharedMemory
+import os
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+CHUNKS_PER_WORKER = 4
+
+
+def parallel_map(items: NDArray | list, fn: Callable[[Any], Any], workers: int | None = None) -> list:
+    ''' Returns [fn(item) for item in items], computed by up to workers processes (default: one per CPU). '''
+    parts = _run(items, _map_part, fn, workers)
+    return [result for part in parts for result in part]
+
+
+def parallel_reduce(items: NDArray | list, fn: Callable[[Any, Any], Any], initial: Any, workers: int | None = None) -> Any:
+    ''' Folds items into initial with fn, computed by up to workers processes (default: one per CPU).
+        Each worker folds its own chunks and the partial results are folded in order afterwards, so fn must be
+        associative, as it is for sums, products, min and max.
+    '''
+    return reduce(fn, _run(items, _reduce_part, fn, workers), initial)
+
+
+def parallel_map_tiles(tiles: NDArray, rows: int, cols: int, fn: Callable[[NDArray], NDArray],
+                       workers: int | None = None) -> NDArray:
+    ''' Returns a new (tile rows, tile columns, size, size) array holding fn(tile) for every tile of a rows x cols
+        grid, computed by up to workers processes (default: one per CPU). Edge tiles are passed to fn without
+        their padding. For bool, int and float tiles, the workers read their tiles from shared memory and write
+        the results into a shared output buffer.
+    '''
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError("There must be at least one worker")
+    indices = [(i, j) for i in range(tiles.shape[0]) for j in range(tiles.shape[1])]
+    if workers == 1 or len(indices) <= 1 or tiles.dtype == object:
+        result = np.zeros_like(tiles)
+        if tiles.dtype == object:
+            result.fill(None)
+        _tiles_part(fn, tiles, result, rows, cols, indices)
+        return result
+    step = -(-len(indices) // (workers * CHUNKS_PER_WORKER))
+    source = SharedMemory(create=True, size=tiles.nbytes)
+    target = SharedMemory(create=True, size=tiles.nbytes)
+    try:
+        np.ndarray(tiles.shape, dtype=tiles.dtype, buffer=source.buf)[:] = tiles
+        np.ndarray(tiles.shape, dtype=tiles.dtype, buffer=target.buf).fill(0)
+        with ProcessPoolExecutor(max_workers=min(workers, -(-len(indices) // step))) as pool:
+            futures = [pool.submit(_shared_tiles_part, fn, source.name, target.name, tiles.dtype.str, tiles.shape,
+                                   rows, cols, indices[start:start + step]) for start in range(0, len(indices), step)]
+            for future in futures:
+                future.result()
+        return np.ndarray(tiles.shape, dtype=tiles.dtype, buffer=target.buf).copy()
+    finally:
+        for memory in (source, target):
+            memory.close()
+            memory.unlink()
+
+
+def _map_part(items: list, fn: Callable[[Any], Any]) -> list:
+    return [fn(item) for item in items]
+
+
+def _reduce_part(items: list, fn: Callable[[Any, Any], Any]) -> Any:
+    return reduce(fn, items)
+
+
+def _run(items: NDArray | list, task: Callable[[list, Callable], Any], fn: Callable, workers: int | None) -> list:
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError("There must be at least one worker")
+    if len(items) == 0:
+        return []
+    if workers == 1 or len(items) == 1:
+        return [task(items.tolist() if isinstance(items, np.ndarray) else list(items), fn)]
+    step = -(-len(items) // (workers * CHUNKS_PER_WORKER))
+    bounds = [(start, min(start + step, len(items))) for start in range(0, len(items), step)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+        if isinstance(items, np.ndarray) and items.dtype != object:
+            memory = SharedMemory(create=True, size=items.nbytes)
+            try:
+                np.ndarray(items.shape, dtype=items.dtype, buffer=memory.buf)[:] = items
+                futures = [pool.submit(_shared_part, task, fn, memory.name, items.dtype.str, start, stop)
+                           for start, stop in bounds]
+                return [future.result() for future in futures]
+            finally:
+                memory.close()
+                memory.unlink()
+        futures = [pool.submit(task, list(items[start:stop]), fn) for start, stop in bounds]
+        return [future.result() for future in futures]
+
+
+def _shared_part(task: Callable[[list, Callable], Any], fn: Callable, name: str, dtype: str, start: int, stop: int) -> Any:
+    # pool workers share the parent's resource tracker, which forgets the block once the parent unlinks it
+    memory = SharedMemory(name)
+    try:
+        dtype = np.dtype(dtype)
+        items = np.ndarray((stop - start,), dtype=dtype, buffer=memory.buf, offset=start * dtype.itemsize).tolist()
+    finally:
+        memory.close()
+    return task(items, fn)
+
+
+def _tiles_part(fn: Callable[[NDArray], NDArray], tiles: NDArray, result: NDArray, rows: int, cols: int,
+                indices: list[tuple[int, int]]) -> None:
+    size = tiles.shape[2]
+    for i, j in indices:
+        height, width = min(size, rows - i * size), min(size, cols - j * size)
+        result[i, j, :height, :width] = fn(tiles[i, j, :height, :width])
+
+
+def _shared_tiles_part(fn: Callable[[NDArray], NDArray], source_name: str, target_name: str, dtype: str,
+                       shape: tuple[int, ...], rows: int, cols: int, indices: list[tuple[int, int]]) -> None:
+    source, target = SharedMemory(source_name), SharedMemory(target_name)
+    try:
+        _tiles_part(fn, np.ndarray(shape, dtype=np.dtype(dtype), buffer=source.buf),
+                    np.ndarray(shape, dtype=np.dtype(dtype), buffer=target.buf), rows, cols, indices)
+    finally:
+        for memory in (source, target):
+            try:
+                memory.close()
+            except BufferError:
+                # an exception raised by fn still references views of the block; they go with the worker
+                pass
@@ -0,0 +1,88 @@
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Iterator, get_type_hints
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RecordLayout:
+    """ Maps a dataclass onto a numpy structured dtype so an Array can store its instances as packed records
+        instead of one Python object each. bool, int and float fields are stored natively, Enum fields as the
+        position of the member in the Enum, and every other field (str included) as an object reference.
+    """
+
+    _NATIVE_FIELDS = {bool: np.dtype(np.bool_), int: np.dtype(np.int64), float: np.dtype(np.float64)}
+
+    def __init__(self, data_type: type) -> None:
+        ''' Builds the layout for a dataclass.
+
+            Arguments:
+                data_type: The dataclass to lay out
+
+            Raises:
+                ValueError: If data_type is not a dataclass
+        '''
+        if not (isinstance(data_type, type) and is_dataclass(data_type)):
+            raise ValueError("Only dataclasses can be stored as records")
+        try:
+            hints = get_type_hints(data_type)
+        except Exception:
+            hints = {}
+        self.data_type = data_type
+        self.names = [field.name for field in fields(data_type)]
+        self.__members: dict[str, list[Enum]] = {}
+        self.__native: dict[str, type] = {}
+        self.__codes: dict[str, dict[Enum, int]] = {}
+        columns = []
+        for name in self.names:
+            field_type = hints.get(name)
+            if isinstance(field_type, type) and issubclass(field_type, Enum):
+                self.__members[name] = list(field_type)
+                self.__codes[name] = {member: code for code, member in enumerate(field_type)}
+                columns.append((name, np.min_scalar_type(max(len(self.__members[name]) - 1, 0))))
+            else:
+                if field_type in self._NATIVE_FIELDS:
+                    self.__native[name] = field_type
+                columns.append((name, self._NATIVE_FIELDS.get(field_type, np.dtype(object))))
+        self.dtype = np.dtype(columns)
+        # object fields other than str may hold mutable values that deserve a deep copy
+        self.holds_references = any(self.dtype[name] == object and hints.get(name) is not str for name in self.names)
+
+    def encode(self, item: Any) -> tuple:
+        ''' Returns the record for an instance of the dataclass.
+
+            Raises:
+                TypeError: If a bool, int or float field holds another type or an int too large for 64 bits, or
+                    an Enum field holds something other than a member of its Enum
+        '''
+        for name, field_type in self.__native.items():
+            value = getattr(item, name)
+            # numpy would silently cast a float into an int field, or a str into a bool one
+            if not isinstance(value, field_type) or (field_type is int and not -2**63 <= value < 2**63):
+                raise TypeError(f"{item!r} has a field that does not match {self.data_type.__name__}")
+        try:
+            return tuple(self.__codes[name][value] if name in self.__codes else value
+                         for name, value in ((name, getattr(item, name)) for name in self.names))
+        except KeyError:
+            raise TypeError(f"{item!r} has a field that does not match {self.data_type.__name__}")
+
+    def encode_all(self, items: Iterator[Any], count: int) -> NDArray:
+        ''' Returns a structured array holding the records for count instances. '''
+        try:
+            return np.fromiter((self.encode(item) for item in items), dtype=self.dtype, count=count)
+        except (ValueError, OverflowError):
+            raise TypeError(f"Items have fields that do not match {self.data_type.__name__}")
+
+    def decode(self, record: tuple) -> Any:
+        ''' Rebuilds an instance of the dataclass from a record, without calling __init__ or __post_init__. '''
+        item = object.__new__(self.data_type)
+        for name, value in zip(self.names, record):
+            if name in self.__members:
+                value = self.__members[name][value]
+            object.__setattr__(item, name, value)
+        return item
+
+    def decode_all(self, records: NDArray) -> list[Any]:
+        ''' Rebuilds the instances for a structured array of records. '''
+        return [self.decode(record) for record in records.tolist()]
@@ -0,0 +1,284 @@
+# datastructures.ropearray.RopeArray
+
+""" This module defines a RopeArray class, a one-dimensional array for editing workloads.
+    See the stipulations in iarray.py for more information on the methods and their expected behavior.
+"""
+
+from __future__ import annotations
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import os
+import random
+from typing import Any, Iterator, Optional, overload
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import Array
+from datastructures.iarray import IArray, T
+
+
+class RopeArray(IArray[T]):
+    """ A sequence stored as fixed-size numpy chunks kept in order by a balanced tree (an implicit treap).
+        Every tree node is one chunk and knows how many items and chunks its subtree holds, so finding an
+        index, inserting or deleting anywhere costs O(log n) to reach the chunk plus one small shift
+        inside it. Full chunks split in two, and nearly empty chunks merge with their right neighbour.
+    """
+
+    @dataclass
+    class Chunk:
+        items: NDArray
+        count: int
+        priority: float = field(default_factory=random.random)
+        left: Optional[RopeArray.Chunk] = None
+        right: Optional[RopeArray.Chunk] = None
+        size: int = 0       # items in this subtree
+        chunks: int = 1     # chunks in this subtree
+
+    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object, chunk_size: int=512) -> None:
+        if not isinstance(starting_sequence, (Sequence, np.ndarray)):
+            raise ValueError("This should raise because starting_sequence is not a sequence")
+        if not isinstance(data_type, type):
+            raise ValueError("This should raise because data_type is not a type, it's a data value")
+        if chunk_size < 4:
+            raise ValueError("Chunks must hold at least 4 items")
+        self.__data_type = data_type
+        self.__chunk_size = chunk_size
+        # Array validates and copies the items and picks the buffer dtype, the chunks just slice its buffer
+        items = np.asarray(Array.from_iterable(starting_sequence, data_type=data_type))
+        self.__dtype = items.dtype
+        self.__root: Optional[RopeArray.Chunk] = None
+        fill = chunk_size - chunk_size // 4
+        for start in range(0, len(items), fill):
+            self.__root = self.__merge(self.__root, self.__new_chunk(items[start:start + fill]))
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        if isinstance(index, int):
+            _, chunk, offset, _ = self.__locate(self.__check_index(index))
+            item = chunk.items[offset]
+            return item.item() if isinstance(item, np.generic) else item
+        elif isinstance(index, slice):
+            for bound in (index.start, index.stop):
+                if bound is not None and not (-len(self) <= bound <= len(self)):
+                    raise IndexError("Index out of bounds")
+            return RopeArray([self[i] for i in range(*index.indices(len(self)))], self.__data_type, self.__chunk_size)
+        else:
+            raise TypeError
+
+    def __setitem__(self, index: int, item: T) -> None:
+        if not isinstance(item, self.__data_type):
+            raise TypeError("Item is wrong type")
+        _, chunk, offset, _ = self.__locate(self.__check_index(index))
+        chunk.items[offset] = item
+
+    def insert(self, index: int, item: T) -> None:
+        ''' Inserts an item before index in O(log n): the chunk holding index is found through the tree and
+            only the items after index in that chunk are shifted.
+
+            Examples:
+                >>> rope = RopeArray([0, 1, 3], data_type=int)
+                >>> rope.insert(2, 2)
+                >>> print(rope)
+                [0, 1, 2, 3]
+
+            Arguments:
+                index: The position the item will have. len(rope) appends
+                item: The item to insert
+
+            Raises:
+                IndexError: If index is out of bounds
+                TypeError: If item is not of the RopeArray's data type
+        '''
+        if not (-len(self) <= index <= len(self)):
+            raise IndexError("Index out of bounds")
+        if not isinstance(item, self.__data_type):
+            raise TypeError("Data type does not match array")
+        if index < 0:
+            index += len(self)
+        if self.__root is None:
+            self.__root = self.__new_chunk(np.empty(0, dtype=self.__dtype))
+            self.__root.items[0] = item
+            self.__root.count = self.__root.size = 1
+            return
+        ordinal, chunk, offset, path = self.__locate(min(index, len(self) - 1))
+        if index == len(self):
+            offset = chunk.count
+        if chunk.count == self.__chunk_size:
+            # split the full chunk in two and look the index up again
+            half = chunk.count // 2
+            lower = self.__new_chunk(chunk.items[:half])
+            upper = self.__new_chunk(chunk.items[half:chunk.count])
+            self.__replace(ordinal, 1, [lower, upper])
+            chunk, offset = (lower, offset) if offset <= half else (upper, offset - half)
+            path = self.__locate(index - offset)[3]
+        chunk.items[offset + 1:chunk.count + 1] = chunk.items[offset:chunk.count]
+        chunk.items[offset] = item
+        chunk.count += 1
+        for node in path:
+            node.size += 1
+
+    def append(self, data: T) -> None:
+        self.insert(len(self), data)
+
+    def append_front(self, data: T) -> None:
+        self.insert(0, data)
+
+    def pop(self) -> None:
+        if len(self) == 0:
+            raise IndexError("Cannot pop from an empty array")
+        del self[-1]
+
+    def pop_front(self) -> None:
+        if len(self) == 0:
+            raise IndexError("Cannot pop from an empty array")
+        del self[0]
+
+    def __len__(self) -> int:
+        return self.__root.size if self.__root else 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RopeArray):
+            return False
+        if len(other) != len(self):
+            return False
+        for mine, theirs in zip(self, other):
+            if mine != theirs:
+                return False
+        return True
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk in self.__chunks():
+            yield from chunk.items[:chunk.count].tolist()
+
+    def __reversed__(self) -> Iterator[T]:
+        for chunk in self.__chunks(reverse=True):
+            yield from chunk.items[chunk.count - 1::-1].tolist() if chunk.count else []
+
+    def __delitem__(self, index: int) -> None:
+        ordinal, chunk, offset, path = self.__locate(self.__check_index(index))
+        chunk.items[offset:chunk.count - 1] = chunk.items[offset + 1:chunk.count]
+        chunk.count -= 1
+        for node in path:
+            node.size -= 1
+        if chunk.count == 0:
+            self.__replace(ordinal, 1, [])
+        elif chunk.count < self.__chunk_size // 4 and ordinal + 1 < self.__root.chunks:
+            neighbour = self.__locate_chunk(ordinal + 1)
+            if chunk.count + neighbour.count <= self.__chunk_size // 2:
+                merged = np.concatenate((chunk.items[:chunk.count], neighbour.items[:neighbour.count]))
+                self.__replace(ordinal, 2, [self.__new_chunk(merged)])
+
+    def __contains__(self, item: Any) -> bool:
+        return any(item in chunk.items[:chunk.count].tolist() for chunk in self.__chunks())
+
+    def clear(self) -> None:
+        self.__root = None
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        chunks = self.__root.chunks if self.__root else 0
+        return f'RopeArray {self.__str__()}, Logical: {len(self)}, Chunks: {chunks} of {self.__chunk_size}, type: {self.__data_type}'
+
+    def __check_index(self, index: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError
+        if not (-len(self) <= index < len(self)):
+            raise IndexError("Index out of bounds")
+        return index + len(self) if index < 0 else index
+
+    def __new_chunk(self, items: NDArray) -> RopeArray.Chunk:
+        buffer = np.empty(self.__chunk_size, dtype=self.__dtype)
+        buffer[:len(items)] = items
+        return RopeArray.Chunk(buffer, len(items), size=len(items))
+
+    def __locate(self, index: int) -> tuple[int, RopeArray.Chunk, int, list[RopeArray.Chunk]]:
+        # (chunk ordinal, chunk, offset in the chunk, nodes from the root down to the chunk)
+        node, ordinal, path = self.__root, 0, []
+        while node is not None:
+            path.append(node)
+            left_size = node.left.size if node.left else 0
+            left_chunks = node.left.chunks if node.left else 0
+            if index < left_size:
+                node = node.left
+            elif index < left_size + node.count:
+                return ordinal + left_chunks, node, index - left_size, path
+            else:
+                index -= left_size + node.count
+                ordinal += left_chunks + 1
+                node = node.right
+        raise IndexError("Index out of bounds")
+
+    def __locate_chunk(self, ordinal: int) -> RopeArray.Chunk:
+        node = self.__root
+        while node is not None:
+            left_chunks = node.left.chunks if node.left else 0
+            if ordinal < left_chunks:
+                node = node.left
+            elif ordinal == left_chunks:
+                return node
+            else:
+                ordinal -= left_chunks + 1
+                node = node.right
+        raise IndexError("Chunk out of bounds")
+
+    def __chunks(self, reverse: bool=False) -> Iterator[RopeArray.Chunk]:
+        stack, node = [], self.__root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
+            yield node
+            node = node.left if reverse else node.right
+
+    def __replace(self, ordinal: int, count: int, chunks: list[RopeArray.Chunk]) -> None:
+        # swap the count chunks starting at ordinal for new ones
+        before, rest = self.__split(self.__root, ordinal)
+        _, after = self.__split(rest, count)
+        middle = None
+        for chunk in chunks:
+            middle = self.__merge(middle, chunk)
+        self.__root = self.__merge(self.__merge(before, middle), after)
+
+    @staticmethod
+    def __update(node: RopeArray.Chunk) -> None:
+        node.size = node.count + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+        node.chunks = 1 + (node.left.chunks if node.left else 0) + (node.right.chunks if node.right else 0)
+
+    @staticmethod
+    def __merge(first: Optional[RopeArray.Chunk], second: Optional[RopeArray.Chunk]) -> Optional[RopeArray.Chunk]:
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if first.priority > second.priority:
+            first.right = RopeArray.__merge(first.right, second)
+            RopeArray.__update(first)
+            return first
+        second.left = RopeArray.__merge(first, second.left)
+        RopeArray.__update(second)
+        return second
+
+    @staticmethod
+    def __split(node: Optional[RopeArray.Chunk], chunks: int) -> tuple[Optional[RopeArray.Chunk], Optional[RopeArray.Chunk]]:
+        # split into the first `chunks` chunks and the rest
+        if node is None:
+            return None, None
+        left_chunks = node.left.chunks if node.left else 0
+        if chunks <= left_chunks:
+            first, node.left = RopeArray.__split(node.left, chunks)
+            RopeArray.__update(node)
+            return first, node
+        node.right, rest = RopeArray.__split(node.right, chunks - left_chunks - 1)
+        RopeArray.__update(node)
+        return node, rest
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,245 @@
+from __future__ import annotations
+import os
+from typing import Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import _NATIVE_DTYPES
+from datastructures.array2d import Array2D
+from datastructures.iarray2d import IArray2D, T
+
+
+class SparseArray2D(IArray2D[T]):
+    """ A two-dimensional array that only stores the cells that differ from a default value, so its memory
+        grows with the number of stored cells rather than rows x columns.
+
+        Cells are kept in one of two layouts. The 'dok' (dictionary of keys) layout maps (row, column) to the
+        item and is cheap to build and change cell by cell. The 'csr' (compressed sparse row) layout keeps the
+        stored cells of each row together in numpy arrays, which makes row reads and full scans fast. compress()
+        switches to 'csr'; storing an item in a cell that 'csr' does not hold yet switches back to 'dok'.
+    """
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: SparseArray2D, num_columns: int) -> None:
+            self.__row_index = row_index
+            self.__array = array
+            self.__num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            return self.__array[self.__row_index, column_index]
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            self.__array[self.__row_index, column_index] = value
+
+        def __iter__(self) -> Iterator[T]:
+            return iter(self.__array._dense_row(self.__row_index))
+
+        def __reversed__(self) -> Iterator[T]:
+            return reversed(self.__array._dense_row(self.__row_index))
+
+        def __len__(self) -> int:
+            return self.__num_columns
+
+        def __str__(self) -> str:
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            return f'Row {self.__row_index}: {str(self)}'
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object, default: T | None=None) -> None:
+        if not isinstance(starting_sequence, Sequence) or isinstance(starting_sequence, str):
+            raise ValueError("must be a sequence of sequences")
+        for row in starting_sequence:
+            if not isinstance(row, Sequence):
+                raise ValueError("must be a sequence of sequences")
+        self.__num_rows = len(starting_sequence)
+        self.__num_columns = len(starting_sequence[0]) if self.__num_rows else 0
+        self.__start(data_type, default)
+        for row_index, row in enumerate(starting_sequence):
+            if len(row) != self.__num_columns:
+                raise ValueError("must be a sequence of sequences with the same length")
+            for column_index, item in enumerate(row):
+                if not isinstance(item, self.__data_type):
+                    raise ValueError("All items must be of the same type")
+                if item != self.__default:
+                    self.__cells[row_index, column_index] = item
+
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=object, default: T | None=None) -> SparseArray2D[T]:
+        if rows < 0 or cols < 0:
+            raise ValueError("rows and cols cannot be negative")
+        array = SparseArray2D.__new__(SparseArray2D)
+        array.__num_rows, array.__num_columns = rows, cols
+        array.__start(data_type, default)
+        return array
+
+    @staticmethod
+    def from_dense(array2d: Array2D[T], default: T | None=None) -> SparseArray2D[T]:
+        """ Builds a sparse copy of a dense Array2D in the 'csr' layout, finding the stored cells with one
+            vectorized comparison against the default.
+
+        Args:
+            array2d (Array2D[T]): The dense array.
+            default (T | None): The item that is not stored (default: None, meaning data_type()).
+
+        Returns:
+            SparseArray2D[T]: The sparse array.
+        """
+        elements = np.asarray(array2d)
+        array = SparseArray2D.empty(*elements.shape, data_type=array2d.data_type, default=default)
+        rows, columns = np.nonzero(elements != array.__default)
+        array.__to_csr(rows, columns, elements[rows, columns])
+        return array
+
+    def to_dense(self) -> Array2D[T]:
+        """ Returns a dense Array2D holding every cell, with the stored cells scattered in one vectorized write.
+            Default cells of object arrays all refer to the default object, as in Array2D.full.
+        """
+        dense = Array2D.full(self.__num_rows, self.__num_columns, self.__default, self.__data_type)
+        rows, columns, values = self.__stored()
+        np.asarray(dense)[rows, columns] = values
+        return dense
+
+    def compress(self) -> None:
+        """ Switches to the 'csr' layout for fast reads and scans. """
+        if self.__layout == 'dok':
+            self.__to_csr(*self.__stored())
+
+    @property
+    def layout(self) -> str:
+        """ 'dok' or 'csr', see the class docstring. """
+        return self.__layout
+
+    @property
+    def nnz(self) -> int:
+        """ The number of stored, non-default cells. """
+        return len(self.__cells) if self.__layout == 'dok' else len(self.__values)
+
+    @property
+    def default(self) -> T:
+        """ The item every cell that is not stored holds. """
+        return self.__default
+
+    def items(self) -> Iterator[tuple[int, int, T]]:
+        """ Returns an iterator of (row, column, item) for the stored cells only, in row-major order. """
+        rows, columns, values = self.__stored()
+        return zip(rows.tolist(), columns.tolist(), values.tolist())
+
+    def __getitem__(self, index: int | tuple[int, int]) -> SparseArray2D.Row[T] | T:
+        if isinstance(index, tuple):
+            row, column = self.__check_cell(index)
+            if self.__layout == 'dok':
+                return self.__cells.get((row, column), self.__default)
+            position = self.__find(row, column)
+            if position < 0:
+                return self.__default
+            item = self.__values[position]
+            return item.item() if isinstance(item, np.generic) else item
+        if not (-self.__num_rows <= index < self.__num_rows):
+            raise IndexError("Row index out of bounds")
+        if index < 0:
+            index += self.__num_rows
+        return SparseArray2D.Row(index, self, self.__num_columns)
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(index, tuple):
+            raise TypeError("Set items with array2d[row, column] or array2d[row][column]")
+        if not isinstance(value, self.__data_type):
+            raise TypeError("Item is wrong type")
+        row, column = self.__check_cell(index)
+        if self.__layout == 'csr':
+            position = self.__find(row, column)
+            if position >= 0 and value != self.__default:
+                self.__values[position] = value
+                return
+            if position < 0 and value == self.__default:
+                return
+            self.__to_dok()
+        if value == self.__default:
+            self.__cells.pop((row, column), None)
+        else:
+            self.__cells[row, column] = value
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        for i in range(self.__num_rows):
+            yield self[i]
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        for i in range(self.__num_rows - 1, -1, -1):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return self.__num_rows
+
+    def __str__(self) -> str:
+        return f'[{", ".join(f"{str(row)}" for row in self)}]'
+
+    def __repr__(self) -> str:
+        return f'SparseArray2D {self.__num_rows} Rows x {self.__num_columns} Columns, {self.nnz} stored ({self.__layout}), default: {self.__default!r}'
+
+    def _dense_row(self, row: int) -> list[T]:
+        # every item of one row, defaults included, for Row
+        items = [self.__default] * self.__num_columns
+        if self.__layout == 'dok':
+            for column in range(self.__num_columns):
+                if (row, column) in self.__cells:
+                    items[column] = self.__cells[row, column]
+        else:
+            start, stop = self.__indptr[row], self.__indptr[row + 1]
+            for column, item in zip(self.__indices[start:stop].tolist(), self.__values[start:stop].tolist()):
+                items[column] = item
+        return items
+
+    def __start(self, data_type: type, default: T | None) -> None:
+        if not isinstance(data_type, type):
+            raise ValueError("This should raise because data_type is not a type, it's a data value")
+        self.__data_type = data_type
+        self.__dtype = _NATIVE_DTYPES.get(data_type, np.dtype(object))
+        self.__default = data_type() if default is None else default
+        if not isinstance(self.__default, data_type):
+            raise TypeError("Default is the wrong type")
+        self.__layout = 'dok'
+        self.__cells: dict[tuple[int, int], T] = {}
+
+    def __to_csr(self, rows: NDArray, columns: NDArray, values: NDArray) -> None:
+        # rows and columns must be in row-major order
+        self.__indptr = np.zeros(self.__num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.__num_rows), out=self.__indptr[1:])
+        self.__indices = np.asarray(columns, dtype=np.int64)
+        self.__values = np.asarray(values).astype(self.__dtype)
+        self.__cells = {}
+        self.__layout = 'csr'
+
+    def __to_dok(self) -> None:
+        rows, columns, values = self.__stored()
+        self.__cells = dict(zip(zip(rows.tolist(), columns.tolist()), values.tolist()))
+        self.__indptr = self.__indices = self.__values = None
+        self.__layout = 'dok'
+
+    def __stored(self) -> tuple[NDArray, NDArray, NDArray]:
+        # the row, column and item arrays of the stored cells, in row-major order
+        if self.__layout == 'dok':
+            keys = sorted(self.__cells)
+            rows = np.fromiter((row for row, _ in keys), dtype=np.int64, count=len(keys))
+            columns = np.fromiter((column for _, column in keys), dtype=np.int64, count=len(keys))
+            return rows, columns, np.fromiter((self.__cells[key] for key in keys), dtype=self.__dtype, count=len(keys))
+        rows = np.repeat(np.arange(self.__num_rows), np.diff(self.__indptr))
+        return rows, self.__indices, self.__values
+
+    def __find(self, row: int, column: int) -> int:
+        # the position of a cell in the csr arrays, or -1 if it is not stored
+        start, stop = self.__indptr[row], self.__indptr[row + 1]
+        position = start + int(np.searchsorted(self.__indices[start:stop], column))
+        return position if position < stop and self.__indices[position] == column else -1
+
+    def __check_cell(self, index: tuple[int, int]) -> tuple[int, int]:
+        row, column = index
+        if not (-self.__num_rows <= row < self.__num_rows and -self.__num_columns <= column < self.__num_columns):
+            raise IndexError("Index out of bounds")
+        return row % self.__num_rows, column % self.__num_columns
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import os
+from typing import Callable, Iterator, Sequence
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array2d import Array2D
+from datastructures.iarray2d import IArray2D, T
+from datastructures.parallel import parallel_map_tiles
+
+
+class TiledArray2D(IArray2D[T]):
+    """ A two-dimensional array stored as square tiles of tile_size x tile_size cells, each tile contiguous in
+        memory. Cells that are close in any direction share a tile, which keeps neighbourhood and column work
+        in cache, and the tiles are independent units that can be handed to separate worker processes (see
+        map_tiles). The tiles along the bottom and right edges are padded to the full tile size.
+    """
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: TiledArray2D, num_columns: int) -> None:
+            self.__row_index = row_index
+            self.__array = array
+            self.__num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            return self.__array[self.__row_index, column_index]
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            self.__array[self.__row_index, column_index] = value
+
+        def __iter__(self) -> Iterator[T]:
+            return iter(self.__array._dense_row(self.__row_index))
+
+        def __reversed__(self) -> Iterator[T]:
+            return reversed(self.__array._dense_row(self.__row_index))
+
+        def __len__(self) -> int:
+            return self.__num_columns
+
+        def __str__(self) -> str:
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            return f'Row {self.__row_index}: {str(self)}'
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object, tile_size: int=64) -> None:
+        # Array2D validates the items, then they are cut into tiles
+        dense = Array2D(starting_sequence, data_type)
+        self.__start(np.asarray(dense), dense.data_type, tile_size)
+
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=object, tile_size: int=64) -> TiledArray2D[T]:
+        return TiledArray2D.from_dense(Array2D.empty(rows, cols, data_type), tile_size)
+
+    @staticmethod
+    def from_dense(array2d: Array2D[T], tile_size: int=64) -> TiledArray2D[T]:
+        """ Builds a tiled copy of a dense Array2D.
+
+        Args:
+            array2d (Array2D[T]): The dense array.
+            tile_size (int): The number of rows and columns of a tile (default: 64).
+
+        Returns:
+            TiledArray2D[T]: The tiled array.
+        """
+        array = TiledArray2D.__new__(TiledArray2D)
+        array.__start(np.asarray(array2d), array2d.data_type, tile_size)
+        return array
+
+    def to_dense(self) -> Array2D[T]:
+        """ Returns a dense, row-major Array2D holding a copy of every cell. """
+        elements = self.__untiled()
+        if elements.dtype == object:
+            return Array2D(elements.tolist(), self.__data_type) if self.__num_rows else Array2D.empty(0, 0, self.__data_type)
+        return Array2D.from_numpy(elements)
+
+    @property
+    def tile_size(self) -> int:
+        """ The number of rows and columns of a tile. """
+        return self.__tile_size
+
+    def tiles(self) -> Iterator[tuple[int, int, NDArray]]:
+        """ Returns an iterator of (tile_row, tile_col, view) for every tile in row-major order. Each view is the
+            contiguous numpy array of the tile without its padding, and writes through it change the array.
+
+        Examples:
+            >>> array = TiledArray2D([[1, 2, 3], [4, 5, 6]], data_type=int, tile_size=2)
+            >>> print([(i, j, view.tolist()) for i, j, view in array.tiles()])
+            [(0, 0, [[1, 2], [4, 5]]), (0, 1, [[3], [6]])]
+        """
+        size = self.__tile_size
+        for i in range(self.__tiles.shape[0]):
+            for j in range(self.__tiles.shape[1]):
+                yield i, j, self.__tiles[i, j, :min(size, self.__num_rows - i * size), :min(size, self.__num_columns - j * size)]
+
+    def map_tiles(self, fn: Callable[[NDArray], NDArray], workers: int | None=None) -> TiledArray2D[T]:
+        """ Returns a new TiledArray2D holding fn(view) for the view of every tile, computed by a pool of worker
+            processes. bool, int and float tiles are shared with the workers through shared memory. fn must be
+            picklable (defined at the top level of a module), and return an array of the view's shape whose
+            items fit the data type.
+
+        Args:
+            fn (Callable[[NDArray], NDArray]): Maps the view of one tile to its new items.
+            workers (int | None): The number of processes (default: None, one per CPU). 1 runs fn in this process.
+
+        Returns:
+            TiledArray2D[T]: The mapped array, with the same shape and tile size.
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        tiles = parallel_map_tiles(self.__tiles, self.__num_rows, self.__num_columns, fn, workers)
+        array = TiledArray2D.__new__(TiledArray2D)
+        array.__data_type, array.__tile_size = self.__data_type, self.__tile_size
+        array.__num_rows, array.__num_columns = self.__num_rows, self.__num_columns
+        array.__tiles = tiles
+        return array
+
+    def __getitem__(self, index: int | tuple[int, int]) -> TiledArray2D.Row[T] | T:
+        if isinstance(index, tuple):
+            item = self.__tiles[self.__locate(index)]
+            return item.item() if isinstance(item, np.generic) else item
+        if not (-self.__num_rows <= index < self.__num_rows):
+            raise IndexError("Row index out of bounds")
+        if index < 0:
+            index += self.__num_rows
+        return TiledArray2D.Row(index, self, self.__num_columns)
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(index, tuple):
+            raise TypeError("Set items with array2d[row, column] or array2d[row][column]")
+        if not isinstance(value, self.__data_type):
+            raise TypeError("Item is wrong type")
+        self.__tiles[self.__locate(index)] = value
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        for i in range(self.__num_rows):
+            yield self[i]
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        for i in range(self.__num_rows - 1, -1, -1):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return self.__num_rows
+
+    def __str__(self) -> str:
+        return f'[{", ".join(f"{str(row)}" for row in self)}]'
+
+    def __repr__(self) -> str:
+        return f'TiledArray2D {self.__num_rows} Rows x {self.__num_columns} Columns in {self.__tile_size}x{self.__tile_size} tiles, items: {str(self)}'
+
+    def _dense_row(self, row: int) -> list[T]:
+        # every item of one row, gathered from the tiles it crosses, for Row
+        return self.__tiles[row // self.__tile_size, :, row % self.__tile_size, :].reshape(-1)[:self.__num_columns].tolist()
+
+    def __start(self, elements: NDArray, data_type: type, tile_size: int) -> None:
+        if tile_size < 1:
+            raise ValueError("Tiles must be at least 1x1")
+        self.__data_type, self.__tile_size = data_type, tile_size
+        self.__num_rows, self.__num_columns = elements.shape
+        tile_rows, tile_cols = -(-self.__num_rows // tile_size), -(-self.__num_columns // tile_size)
+        padded = np.zeros((tile_rows * tile_size, tile_cols * tile_size), dtype=elements.dtype)
+        if elements.dtype == object:
+            padded.fill(None)
+        padded[:self.__num_rows, :self.__num_columns] = elements
+        # (tile row, tile column, row in tile, column in tile), copied so every tile is contiguous
+        self.__tiles = np.ascontiguousarray(padded.reshape(tile_rows, tile_size, tile_cols, tile_size).transpose(0, 2, 1, 3))
+
+    def __untiled(self) -> NDArray:
+        tile_rows, tile_cols, size, _ = self.__tiles.shape
+        padded = self.__tiles.transpose(0, 2, 1, 3).reshape(tile_rows * size, tile_cols * size)
+        return padded[:self.__num_rows, :self.__num_columns].copy()
+
+    def __locate(self, index: tuple[int, int]) -> tuple[int, int, int, int]:
+        row, column = index
+        if not (-self.__num_rows <= row < self.__num_rows and -self.__num_columns <= column < self.__num_columns):
+            raise IndexError("Index out of bounds")
+        row, column = row % self.__num_rows, column % self.__num_columns
+        size = self.__tile_size
+        return row // size, column // size, row % size, column % size
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -1,6 +1,7 @@
 from .grid import Grid
 from datastructures.array import Array
 from datastructures.array2d import Array2D
+import os
 import time
 from .kbhit import KBHit
 from copy import deepcopy
@@ -55,22 +56,10 @@ class GameController:
                     print("Random start generated")
                     self.__asking = False
                 elif c == "l": # uses a config file 
-                    file = open("projects\project2\start.txt", "r")
-                    rowcount = 0
-                    for row in file:
-                        if row[0] == "#":
-                            pass
-                        else:
-                            if rowcount == 0:
-                                rowcount += 1
-                                rows = int(row)
-                            elif rowcount == 1:
-                                rowcount += 1
-                                columns = int(row)
-                                start_seq = []
-                            else:
-                                start_seq.append(row)
-                    self.__current = Grid(start = start_seq, xwidth = columns, yheight = rows)
+                    start_grid = Array2D.load(os.path.join("projects", "project2", "start.txt"))
+                    rows = len(start_grid)
+                    columns = len(start_grid[0]) if rows else 0
+                    self.__current = Grid(start = start_grid, xwidth = columns, yheight = rows)
                     print("Start loaded from config file")
                     self.__asking = False
         
@@ -195,9 +184,10 @@ class GameController:
         the current game to end.
         """
         next_grid = Grid(xwidth = self.__current.get_width(), yheight = self.__current.get_height())
+        counts = self.__current.neighbor_counts()
         for i in range(self.__current.get_width()):
             for j in range(self.__current.get_height()):
-                neighbors = self.__current.num_neighbors(xindex=i, yindex=j)
+                neighbors = counts[j, i]
                 this_cell = self.__current.get_cell_status(xindex=i, yindex=j)
                 match [this_cell, neighbors]:
                     case [False, 3] | [True, 2] | [True, 3]:
@@ -10,8 +10,8 @@ class Grid:
         """
         Creates the grid. Either uses a starting sequence or initial dimensions with all dead cells.
         If the starting sequence is "RANDOM", the grid will be initialized with each cell
-        randomly either alive or dead. Otherwise, takes in an Array2D as read by the
-        gamecontroller to make a grid according to a config file.
+        randomly either alive or dead. Otherwise, takes in the bool Array2D read from a config
+        file by Array2D.load (or rows of "X" and "-" characters) to make a grid accordingly.
         """
         if start == None or start == "RANDOM":
             if xwidth == None or yheight == None:
@@ -29,7 +29,7 @@ class Grid:
         elif start != None:
             for row in range(self.__height):
                 for col in range(self.__width):
-                    if start[row][col] == "X":
+                    if start[row][col] is True or start[row][col] == "X":
                         self.set_cell_status(xindex=col,yindex=row, status=True)
 
 
@@ -47,10 +47,18 @@ class Grid:
                 elif row == yindex and col == xindex:
                     pass
                 else:
-                    if self.__grid[row][col].get_status() == True:
+                    if self.__grid[row, col].get_status() == True:
                         neighbors += 1
         return neighbors
 
+    def neighbor_counts(self) -> Array2D:
+        """
+        Returns the number of neighbors of every cell at once, indexed [yindex, xindex].
+        Counted in one vectorized pass over the whole grid instead of a num_neighbors call per cell.
+        """
+        alive = Array2D([[cell.get_status() for cell in row] for row in self.__grid], data_type=bool)
+        return alive.neighbor_sum()
+
     def get_width(self) -> int:
         """
         Getter function for grid width.
@@ -72,7 +80,7 @@ class Grid:
         elif yindex < 0 or yindex >= self.__height:
             raise IndexError("Index out of bounds for finding a cell")
         else:
-            return self.__grid[yindex][xindex].get_status()
+            return self.__grid[yindex, xindex].get_status()
 
     def set_cell_status(self, xindex:int, yindex:int, status:bool) -> None:
         """
@@ -83,7 +91,7 @@ class Grid:
         elif yindex < 0 or yindex >= self.__height:
             raise IndexError("Index out of bounds for finding a cell")
         else:
-            return self.__grid[yindex][xindex].set_status(status)
+            return self.__grid[yindex, xindex].set_status(status)
 
     def __eq__(self, other) -> bool:
         """
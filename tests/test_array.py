@@ -1,8 +1,21 @@
 import copy
+import gc
+import weakref
+import numpy as np
 import pytest
 from datastructures.array import Array
 
 from tests.car import Car, Color, Make, Model
+from projects.project1.card import Card
+from projects.project1.cardsuit import CardSuit
+from projects.project1.cardvalue import CardValue
+from projects.project3.drink import Drink
+
+def square(number: int) -> int:
+    return number * number
+
+def add(first: int, second: int) -> int:
+    return first + second
 
 class TestArray:
     car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
@@ -130,3 +143,436 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_iterating_a_numerical_array_should_yield_python_values(self, setup_numerical_array: Array):
+        assert all(type(item) is int for item in setup_numerical_array)
+
+    def test_constructor_should_raise_a_type_error_if_a_native_array_is_given_mixed_items(self):
+        with pytest.raises(TypeError):
+            Array([1, 2, 'three'], int) #type: ignore
+        with pytest.raises(TypeError):
+            Array([1.5, 2.5], int) #type: ignore
+
+    def test_native_arrays_should_compare_and_search_by_value(self):
+        floats = Array([0.5, 1.5, 2.5], float)
+        assert floats == Array([0.5, 1.5, 2.5], float)
+        assert 1.5 in floats
+        assert 'string' not in floats
+
+    def test_string_arrays_should_not_truncate_their_items(self):
+        array = Array(['zero', 'one'], str)
+        array.append('two')
+        assert list(array) == ['zero', 'one', 'two']
+
+    def test_popping_should_shrink_the_array_without_losing_items(self, setup_numerical_array: Array):
+        for _ in range(8):
+            setup_numerical_array.pop()
+        assert list(setup_numerical_array) == [0, 1]
+
+    def test_append_front_should_add_items_in_front_of_existing_items(self):
+        array = Array[int](starting_sequence=[], data_type=int)
+        for num in range(10, 0, -1):
+            array.append_front(num)
+        array.append(11)
+        assert list(array) == [num for num in range(1, 12)]
+
+    def test_array_should_work_as_a_queue_from_either_end(self, setup_numerical_array: Array):
+        for num in range(10, 100):
+            setup_numerical_array.append(num)
+            setup_numerical_array.pop_front()
+        assert list(setup_numerical_array) == [num for num in range(90, 100)]
+        for num in range(10):
+            setup_numerical_array.append_front(num)
+            setup_numerical_array.pop()
+        assert list(setup_numerical_array) == [num for num in range(9, -1, -1)]
+
+    def test_pop_front_should_raise_an_index_error_if_the_array_is_empty(self):
+        with pytest.raises(IndexError):
+            Array[int](starting_sequence=[], data_type=int).pop_front()
+
+    def test_del_operator_should_keep_order_when_deleting_from_either_half(self, setup_numerical_array: Array):
+        setup_numerical_array.append_front(-1)
+        del setup_numerical_array[2]
+        del setup_numerical_array[-2]
+        assert list(setup_numerical_array) == [-1, 0, 2, 3, 4, 5, 6, 7, 9]
+
+    def test_from_iterable_should_build_an_array_from_a_generator(self):
+        array = Array.from_iterable((i * i for i in range(5)), data_type=int)
+        assert array == Array([0, 1, 4, 9, 16], int)
+
+    def test_from_iterable_without_copy_should_store_the_original_objects(self):
+        copied = Array.from_iterable([self.car1], data_type=Car)
+        shared = Array.from_iterable([self.car1], data_type=Car, copy=False)
+        assert copied[0] is not self.car1
+        assert shared[0] is self.car1
+
+    def test_extend_should_append_every_item_in_order(self, setup_numerical_array: Array):
+        setup_numerical_array.extend(range(10, 15))
+        setup_numerical_array.extend(setup_numerical_array)
+        assert list(setup_numerical_array) == [i for i in range(15)] * 2
+
+    def test_extend_should_leave_the_array_unchanged_if_any_item_has_the_wrong_type(self, setup_numerical_array: Array):
+        with pytest.raises(TypeError):
+            setup_numerical_array.extend([10, 'eleven'])
+        assert len(setup_numerical_array) == 10
+
+    def test_with_capacity_should_return_an_empty_array_that_accepts_appends(self):
+        array = Array.with_capacity(4, data_type=str)
+        assert len(array) == 0
+        for word in ['zero', 'one', 'two', 'three', 'four']:
+            array.append(word)
+        assert list(array) == ['zero', 'one', 'two', 'three', 'four']
+        with pytest.raises(ValueError):
+            Array.with_capacity(-1)
+
+    def test_slicing_should_support_open_ended_and_stepped_slices(self, setup_numerical_array: Array):
+        assert list(setup_numerical_array[:3]) == [0, 1, 2]
+        assert list(setup_numerical_array[-3:]) == [7, 8, 9]
+        assert list(setup_numerical_array[::3]) == [0, 3, 6, 9]
+        assert list(setup_numerical_array[::-4]) == [9, 5, 1]
+
+    def test_mutating_a_slice_should_not_change_the_original_array(self, setup_numerical_array: Array):
+        sliced = setup_numerical_array[2:6]
+        sliced[0] = 100
+        sliced.append(200)
+        assert list(sliced) == [100, 3, 4, 5, 200]
+        assert list(setup_numerical_array) == [i for i in range(10)]
+
+    def test_mutating_the_original_array_should_not_change_a_slice(self, setup_numerical_array: Array):
+        sliced = setup_numerical_array[5:]
+        for _ in range(5):
+            setup_numerical_array.pop()
+        setup_numerical_array.extend([50, 60, 70])
+        del setup_numerical_array[0]
+        assert list(sliced) == [5, 6, 7, 8, 9]
+        assert list(setup_numerical_array) == [1, 2, 3, 4, 50, 60, 70]
+
+    def test_shallow_copy_should_be_independent_of_the_original_array(self, setup_numerical_array: Array):
+        array = copy.copy(setup_numerical_array)
+        array[0] = 100
+        assert setup_numerical_array[0] == 0
+
+    def test_reserve_should_stop_the_array_from_reallocating_or_shrinking(self):
+        array = Array[int](starting_sequence=[], data_type=int)
+        array.reserve(100)
+        for num in range(100):
+            array.append(num)
+        assert array.capacity == 100
+        for _ in range(100):
+            array.pop()
+        assert array.capacity == 100
+
+    def test_shrink_to_fit_should_make_the_physical_size_equal_the_logical_size(self, setup_numerical_array: Array):
+        setup_numerical_array.append(10)
+        assert setup_numerical_array.capacity == 20
+        setup_numerical_array.shrink_to_fit()
+        assert setup_numerical_array.capacity == 11
+        assert list(setup_numerical_array) == [i for i in range(11)]
+
+    def test_growth_factor_and_shrink_threshold_should_control_resizing(self):
+        array = Array[int](starting_sequence=[1, 2, 3, 4], data_type=int, growth_factor=3, shrink_threshold=0.1)
+        array.append(5)
+        assert array.capacity == 12
+        for _ in range(3):
+            array.pop()
+        assert array.capacity == 12
+        array.pop()
+        assert array.capacity == 4
+        with pytest.raises(ValueError):
+            array.growth_factor = 1
+        with pytest.raises(ValueError):
+            array.shrink_threshold = 0.5
+
+    def test_numpy_should_read_the_array_without_copying(self, setup_numerical_array: Array):
+        exported = np.asarray(setup_numerical_array)
+        assert exported.dtype == np.int64
+        assert exported.sum() == 45
+        exported[0] = 100
+        assert setup_numerical_array[0] == 100
+
+    def test_slices_taken_after_an_export_should_not_see_writes_through_it(self, setup_numerical_array: Array):
+        exported = np.asarray(setup_numerical_array)
+        sliced = setup_numerical_array[:3]
+        exported[0] = 100
+        assert setup_numerical_array[0] == 100
+        assert list(sliced) == [0, 1, 2]
+        sliced[1] = 10
+        assert setup_numerical_array[1] == 1
+
+    def test_growing_should_not_move_items_under_an_exported_or_borrowed_buffer(self):
+        array = Array(range(8), int)
+        exported = np.asarray(array)
+        values = np.arange(8)
+        borrowed = Array.from_numpy(values, copy=False)
+        for grown in (array, borrowed):
+            for _ in range(5):
+                grown.pop_front()
+            grown.append(100)
+            assert list(grown) == [5, 6, 7, 100]
+        assert exported.tolist() == list(range(8))
+        assert values.tolist() == list(range(8))
+
+    def test_popping_should_release_the_popped_objects(self):
+        cars = [Car(str(i), Color.RED, Make.TOYOTA, Model.CAMRY) for i in range(8)]
+        refs = [weakref.ref(car) for car in cars]
+        array = Array.from_iterable(cars, data_type=Car, copy=False)
+        del cars
+        array.pop()
+        array.pop_front()
+        array.pop()
+        gc.collect()
+        assert sum(ref() is not None for ref in refs) == 5
+
+    def test_deleting_and_removing_should_release_the_dropped_objects(self):
+        cars = [Car(str(i), Color.RED, Make.TOYOTA, Model.CAMRY) for i in range(10)]
+        refs = [weakref.ref(car) for car in cars]
+        array = Array.from_iterable(cars, data_type=Car, copy=False)
+        del cars
+        array.delete_range(1, 3)
+        array.delete_range(5, 7)
+        array.remove_if(lambda car: car.vin in ('0', '9'))
+        gc.collect()
+        assert [ref() is not None for ref in refs] == [False, False, False, True, True, True, True, False, False, False]
+        assert [car.vin for car in array] == ['3', '4', '5', '6']
+
+    def test_memoryview_should_expose_the_logical_items(self, setup_numerical_array: Array):
+        setup_numerical_array.pop_front()
+        assert memoryview(setup_numerical_array).tolist() == [i for i in range(1, 10)]
+
+    def test_from_numpy_should_share_memory_unless_asked_to_copy(self):
+        values = np.arange(5)
+        shared = Array.from_numpy(values)
+        copied = Array.from_numpy(values, copy=True)
+        shared[0] = 10
+        assert values[0] == 10
+        assert copied[0] == 0
+        assert copied == Array([0, 1, 2, 3, 4], int)
+
+    def test_from_numpy_should_pick_the_data_type_from_the_dtype(self):
+        assert 0.5 in Array.from_numpy(np.array([0.5, 1.5]))
+        assert list(Array.from_numpy(np.array(['a', 'bc']))) == ['a', 'bc']
+        with pytest.raises(ValueError):
+            Array.from_numpy(np.zeros((2, 2)))
+
+    def test_memmap_should_persist_items_after_flush(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        array = Array.memmap(path, data_type=int)
+        array.extend(range(1000))
+        array.append_front(-1)
+        array.pop()
+        array.flush()
+        reopened = Array.memmap(path, readonly=True)
+        assert len(reopened) == 1000
+        assert list(reopened[:3]) == [-1, 0, 1]
+        assert reopened[-1] == 998
+
+    def test_memmap_should_grow_the_file_as_items_are_appended(self, tmp_path):
+        path = tmp_path / 'floats.bin'
+        array = Array.memmap(path, data_type=float)
+        for num in range(100):
+            array.append(num / 2)
+        array.flush()
+        assert array.capacity >= 100
+        assert path.stat().st_size >= 100 * 8
+        array.shrink_to_fit()
+        assert Array.memmap(path, data_type=float) == Array([num / 2 for num in range(100)], float)
+
+    def test_memmap_should_reject_object_arrays_and_mismatched_files(self, tmp_path):
+        path = tmp_path / 'bools.bin'
+        with pytest.raises(ValueError):
+            Array.memmap(path, data_type=str)
+        Array.memmap(path, data_type=bool).flush()
+        with pytest.raises(ValueError):
+            Array.memmap(path, data_type=int)
+
+    def test_insert_should_put_the_item_before_the_index(self, setup_numerical_array: Array):
+        setup_numerical_array.insert(2, 100)
+        setup_numerical_array.insert(-1, 200)
+        setup_numerical_array.insert(len(setup_numerical_array), 300)
+        assert list(setup_numerical_array) == [0, 1, 100, 2, 3, 4, 5, 6, 7, 8, 200, 9, 300]
+        with pytest.raises(IndexError):
+            setup_numerical_array.insert(20, 400)
+        with pytest.raises(TypeError):
+            setup_numerical_array.insert(0, 'string')
+
+    def test_insert_many_should_insert_all_items_in_order(self, setup_numerical_array: Array):
+        setup_numerical_array.insert_many(1, [10, 11])
+        setup_numerical_array.insert_many(9, range(20, 23))
+        assert list(setup_numerical_array) == [0, 10, 11, 1, 2, 3, 4, 5, 6, 20, 21, 22, 7, 8, 9]
+
+    def test_delete_range_should_remove_the_items_between_start_and_stop(self, setup_numerical_array: Array):
+        setup_numerical_array.delete_range(1, 3)
+        setup_numerical_array.delete_range(-3, -1)
+        setup_numerical_array.delete_range(4, 2)
+        assert list(setup_numerical_array) == [0, 3, 4, 5, 6, 9]
+        with pytest.raises(IndexError):
+            setup_numerical_array.delete_range(0, 7)
+
+    def test_remove_if_should_remove_matching_items_and_shrink_once(self, setup_numerical_array: Array):
+        removed = setup_numerical_array.remove_if(lambda num: num != 4)
+        assert removed == 9
+        assert list(setup_numerical_array) == [4]
+        assert setup_numerical_array.capacity == 5
+
+    def test_sort_should_order_numerical_and_complex_arrays(self, setup_complex_object_array: Array):
+        numbers = Array([3, 1, 2, 5, 4], int)
+        numbers.sort()
+        assert list(numbers) == [1, 2, 3, 4, 5]
+        numbers.sort(reverse=True)
+        assert list(numbers) == [5, 4, 3, 2, 1]
+        numbers.sort(key=lambda num: num % 3)
+        assert list(numbers) == [3, 4, 1, 5, 2]
+        setup_complex_object_array.sort(reverse=True)
+        assert [car.vin for car in setup_complex_object_array] == ['789', '456', '123']
+
+    def test_sorted_flag_should_survive_appends_that_keep_the_order(self, setup_numerical_array: Array):
+        assert setup_numerical_array.is_sorted
+        setup_numerical_array.append(10)
+        setup_numerical_array.append_front(-1)
+        setup_numerical_array.insert(5, 3)
+        assert setup_numerical_array.is_sorted
+        setup_numerical_array[0] = 5
+        assert not setup_numerical_array.is_sorted
+        setup_numerical_array.sort()
+        assert setup_numerical_array.is_sorted
+
+    def test_index_and_count_should_find_items_in_sorted_and_unsorted_arrays(self):
+        assert Array([1, 3, 3, 3, 7], int).count(3) == 3
+        assert Array([3, 7, 3, 1, 3], int).count(3) == 3
+        assert Array(['b', 'a', 'b'], str).count('b') == 2
+        assert Array(['b', 'a', 'b'], str).index('a') == 1
+        assert Array([1, 3, 3, 3, 7], int).index(3) == 1
+        assert Array([3, 7, 3, 1, 3], int).index(3, 1) == 2
+        with pytest.raises(ValueError):
+            Array([1, 3, 7], int).index(5)
+
+    def test_numpy_bools_should_be_found_like_python_bools(self):
+        flags = Array([True, False, True], data_type=bool)
+        assert np.True_ in flags
+        assert flags.count(np.True_) == 2
+        assert flags.index(np.False_) == 1
+
+    def test_searching_a_sorted_array_for_an_incomparable_item_should_not_find_it(self):
+        array = Array(['b'], data_type=str)
+        array.append('c')
+        assert array.count(1) == 0
+        assert 1 not in array
+        with pytest.raises(ValueError):
+            array.index(1)
+
+    def test_bisect_should_return_insertion_points_in_a_sorted_array(self):
+        array = Array([1, 3, 3, 3, 7], int)
+        assert array.bisect_left(3) == 1
+        assert array.bisect_right(3) == 4
+        assert array.bisect_left(10) == 5
+        assert 7 in array and 5 not in array
+
+    def test_record_arrays_should_return_equal_dataclass_instances(self):
+        drinks = [Drink('Latte', 'Medium', 4.5), Drink('Mocha', 'Medium', 5.25)]
+        array = Array(drinks, Drink, records=True)
+        array.append(Drink('Tea', 'Medium', 2.0))
+        array[0] = Drink('Cortado', 'Medium', 4.0)
+        assert list(array) == [Drink('Cortado', 'Medium', 4.0), drinks[1], Drink('Tea', 'Medium', 2.0)]
+        assert Drink('Tea', 'Medium', 2.0) in array
+        assert str(array) == '[Cortado, Medium, $4.00., Mocha, Medium, $5.25., Tea, Medium, $2.00.]'
+
+    def test_record_arrays_should_expose_fields_as_vectorized_columns(self):
+        array = Array([Drink('Latte', 'Medium', 4.5), Drink('Mocha', 'Medium', 5.25)], Drink, records=True)
+        assert array.field('price').sum() == 9.75
+        array.field('price')[:] *= 2
+        assert array[1].price == 10.5
+        with pytest.raises(KeyError):
+            array.field('calories')
+        with pytest.raises(TypeError):
+            Array([1, 2], int).field('real')
+
+    def test_record_arrays_should_pack_enum_fields(self):
+        cards = [Card(CardValue.ACE, CardSuit.SPADE), Card(CardValue.TWO, CardSuit.HEART), Card(CardValue.KING, CardSuit.CLUB)]
+        array = Array(cards, Card, records=True)
+        assert np.asarray(array).nbytes == 6
+        array.sort(key=lambda card: card.suit.value)
+        assert [str(card) for card in array] == ['KC', '2H', 'AS']
+        assert list(array.field('value')) == [11, 0, 12]
+
+    def test_record_arrays_should_reject_fields_of_the_wrong_type(self):
+        array = Array([Drink('Latte', 'Medium', 4.5)], Drink, records=True)
+        for add_item in (array.append, array.append_front, lambda drink: array.insert(0, drink),
+                         lambda drink: array.__setitem__(0, drink), lambda drink: array.extend([drink])):
+            with pytest.raises(TypeError):
+                add_item(Drink('Tea', 'Medium', 'free'))
+            with pytest.raises(TypeError):
+                add_item(Drink('Tea', 'Medium', 2))
+        assert list(array) == [Drink('Latte', 'Medium', 4.5)]
+
+    def test_record_arrays_should_only_accept_dataclasses(self):
+        with pytest.raises(ValueError):
+            Array([self.car1], Car, records=True)
+
+    def test_parallel_map_should_apply_the_function_to_every_item_in_order(self, setup_numerical_array: Array):
+        assert list(setup_numerical_array.parallel_map(square, workers=3)) == [i * i for i in range(10)]
+        assert list(setup_numerical_array.parallel_map(square, workers=1)) == [i * i for i in range(10)]
+        assert list(Array([self.car1, self.car2], Car).parallel_map(str, workers=2, data_type=str)) == [str(self.car1), str(self.car2)]
+
+    def test_parallel_reduce_should_fold_every_item_into_the_initial_value(self, setup_numerical_array: Array):
+        assert setup_numerical_array.parallel_reduce(add, 100, workers=3) == 145
+        assert Array(data_type=int).parallel_reduce(add, 100, workers=3) == 100
+        with pytest.raises(ValueError):
+            setup_numerical_array.parallel_reduce(add, 0, workers=0)
+
+    def test_arithmetic_operators_should_work_item_by_item(self, setup_numerical_array: Array):
+        values = list(range(10))
+        assert list(setup_numerical_array + 1) == [i + 1 for i in values]
+        assert list(10 - setup_numerical_array) == [10 - i for i in values]
+        assert list(setup_numerical_array * setup_numerical_array) == [i * i for i in values]
+        assert list(setup_numerical_array / 2) == [i / 2 for i in values]
+        assert list(setup_numerical_array // 3) == [i // 3 for i in values]
+        assert list(setup_numerical_array % 3) == [i % 3 for i in values]
+        assert list(2 ** setup_numerical_array) == [2 ** i for i in values]
+        with pytest.raises(TypeError):
+            Array([self.car1], Car) + 1
+
+    def test_in_place_operators_should_update_the_array_without_replacing_it(self, setup_numerical_array: Array):
+        sliced = setup_numerical_array[:3]
+        buffer = np.asarray(setup_numerical_array)
+        setup_numerical_array += 10
+        setup_numerical_array *= Array([2] * 10, int)
+        assert list(setup_numerical_array) == [(i + 10) * 2 for i in range(10)]
+        assert np.shares_memory(buffer, np.asarray(setup_numerical_array))
+        assert list(sliced) == [0, 1, 2]
+        with pytest.raises(TypeError):
+            setup_numerical_array /= 2
+
+    def test_comparisons_should_return_masks_that_select_items(self, setup_numerical_array: Array):
+        mask = setup_numerical_array >= 7
+        assert list(mask) == [i >= 7 for i in range(10)]
+        assert list(setup_numerical_array[mask]) == [7, 8, 9]
+        assert list(setup_numerical_array[setup_numerical_array < 2]) == [0, 1]
+        assert setup_numerical_array == Array(list(range(10)), int)
+
+    def test_iterators_should_walk_the_array_in_both_directions(self):
+        array = Array(list(range(1000)), int)
+        assert list(array) == list(range(1000))
+        assert list(reversed(array)) == list(range(999, -1, -1))
+        assert all(type(item) is int for item in array)
+
+    def test_iterators_should_raise_if_the_array_changes_length_during_iteration(self, setup_numerical_array: Array):
+        with pytest.raises(RuntimeError):
+            for item in setup_numerical_array:
+                setup_numerical_array.append(item)
+        with pytest.raises(RuntimeError):
+            for item in reversed(setup_numerical_array):
+                setup_numerical_array.pop()
+        for index, item in enumerate(setup_numerical_array):
+            setup_numerical_array[index] = item * 2
+        assert setup_numerical_array[1] == 2
+
+    def test_chunked_should_yield_contiguous_blocks(self, setup_numerical_array: Array):
+        blocks = list(setup_numerical_array.chunked(4))
+        assert [list(block) for block in blocks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        blocks[0][0] = 100
+        assert setup_numerical_array[0] == 0
+        with pytest.raises(ValueError):
+            setup_numerical_array.chunked(0)
+        with pytest.raises(RuntimeError):
+            for block in setup_numerical_array.chunked(4):
+                setup_numerical_array.clear()
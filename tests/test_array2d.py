@@ -1,3 +1,5 @@
+import copy
+import numpy as np
 import pytest
 
 from datastructures.array2d import Array2D
@@ -108,4 +110,310 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError, match="must be a sequence of sequences with the same length"):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+    # ✅ Test Tuple Indexing
+    def test_tuple_index_reads_and_writes_cells(self, filled3x3: Array2D[int]) -> None:
+        """Checks that arr[r, c] reads and writes the same cells as arr[r][c]."""
+        assert filled3x3[1, 2] == 6
+        assert filled3x3[-1, -1] == 9
+        filled3x3[0, 1] = 20
+        assert filled3x3[0][1] == 20
+        with pytest.raises(IndexError):
+            _ = filled3x3[3, 0]
+        with pytest.raises(TypeError):
+            filled3x3[0, 0] = "one"
+
+    # ✅ Test Rows Are Cached Views
+    def test_rows_are_cached_views(self, filled3x3: Array2D[int]) -> None:
+        """Ensures the same Row is returned for a row index and that it sees later writes."""
+        row = filled3x3[1]
+        assert filled3x3[1] is row
+        assert filled3x3[-2] is row
+        filled3x3[1, 0] = 40
+        assert list(row) == [40, 5, 6]
+        assert list(reversed(row)) == [6, 5, 40]
+
+    # ✅ Test Columns
+    def test_column_views(self, filled3x3: Array2D[int]) -> None:
+        """Checks that columns read and write through to the array."""
+        column = filled3x3.column(1)
+        assert list(column) == [2, 5, 8]
+        column[2] = 80
+        assert filled3x3[2][1] == 80
+        assert [list(col) for col in filled3x3.iter_columns()] == [[1, 4, 7], [2, 5, 80], [3, 6, 9]]
+        with pytest.raises(IndexError):
+            filled3x3.column(3)
+
+    # ✅ Test Transpose
+    def test_transpose_shares_items(self, filled3x3: Array2D[int]) -> None:
+        """Ensures the transpose is a view of the same items."""
+        transposed = filled3x3.T
+        assert str(transposed) == "[[1, 4, 7], [2, 5, 8], [3, 6, 9]]"
+        transposed[0, 2] = 70
+        assert filled3x3[2][0] == 70
+        assert str(filled3x3.transpose().T) == str(filled3x3)
+
+    # ✅ Test Reductions
+    def test_reductions_by_axis(self, filled3x3: Array2D[int]) -> None:
+        """Checks sum, min and max over the whole array and along each axis."""
+        assert filled3x3.sum() == 45
+        assert list(filled3x3.sum(axis=0)) == [12, 15, 18]
+        assert list(filled3x3.sum(axis=1)) == [6, 15, 24]
+        assert filled3x3.min() == 1 and filled3x3.max() == 9
+        assert list(filled3x3.min(axis=1)) == [1, 4, 7]
+        assert list(filled3x3.max(axis=0)) == [7, 8, 9]
+        with pytest.raises(ValueError):
+            filled3x3.sum(axis=2)
+
+    # ✅ Test Rectangular Slicing
+    def test_window_views(self, filled3x3: Array2D[int]) -> None:
+        """Checks that 2D slices are views with their own bounds."""
+        window = filled3x3[1:, 1:]
+        assert str(window) == "[[5, 6], [8, 9]]"
+        assert len(window) == 2
+        window[0, 0] = 50
+        assert filled3x3[1][1] == 50
+        assert list(filled3x3[0, 1:]) == [2, 3]
+        assert list(filled3x3[:, 2]) == [3, 6, 9]
+        assert str(filled3x3[:2]) == "[[1, 2, 3], [4, 50, 6]]"
+        with pytest.raises(IndexError):
+            _ = filled3x3[0:4, 0]
+
+    # ✅ Test Window Assignment
+    def test_window_assignment(self, filled3x3: Array2D[int]) -> None:
+        """Ensures windows can be filled from another Array2D or a single item."""
+        filled3x3[:2, :2] = Array2D([[0, 0], [0, 0]], data_type=int)
+        filled3x3[2:, :] = 1
+        assert str(filled3x3) == "[[0, 0, 3], [0, 0, 6], [1, 1, 1]]"
+        with pytest.raises(ValueError):
+            filled3x3[:2, :2] = Array2D([[1, 2, 3]], data_type=int)
+        with pytest.raises(TypeError):
+            filled3x3[:2, :2] = "zero"
+
+    # ✅ Test Numpy Indexes
+    def test_numpy_integers_index_like_ints(self, filled3x3: Array2D[int]) -> None:
+        """Checks that numpy integers index cells, lines and windows as ints do."""
+        row, column = np.int64(1), np.int32(2)
+        assert filled3x3[row, column] == 6
+        assert filled3x3[row][column] == 6
+        assert list(filled3x3[row, :column]) == [4, 5]
+        assert list(filled3x3[:row, column]) == [3]
+        filled3x3[row, column] = 60
+        assert filled3x3[1, 2] == 60
+        with pytest.raises(IndexError):
+            _ = filled3x3[np.int64(3), :]
+
+    # ✅ Test Row Slicing
+    def test_row_slices_are_views(self, filled3x3: Array2D[int]) -> None:
+        """Checks that slicing a row returns a view and that row slices can be assigned."""
+        part = filled3x3[1][1:]
+        assert list(part) == [5, 6]
+        part[0] = 55
+        assert filled3x3[1][1] == 55
+        filled3x3[2][:2] = [70, 80]
+        assert list(filled3x3[2]) == [70, 80, 9]
+        with pytest.raises(IndexError):
+            _ = filled3x3[0][1:5]
+
+    # ✅ Test Checking Bulk Assignments
+    def test_bulk_assignments_check_items_like_single_ones(self, filled3x3: Array2D[int]) -> None:
+        """Checks that ndarrays, numpy scalars and generators are accepted or rejected by item type."""
+        filled3x3[0][0:2] = np.array([7, 8])
+        filled3x3[1][1:] = (n * 10 for n in range(2))
+        filled3x3[2][:2] = [np.int64(1), np.int32(2)]
+        assert str(filled3x3) == "[[7, 8, 3], [4, 0, 10], [1, 2, 9]]"
+        with pytest.raises(TypeError):
+            filled3x3[0][0:2] = np.array([1.5, 2.5])
+        with pytest.raises(TypeError):
+            filled3x3[0][0:2] = (n / 2 for n in range(2))
+        words = Array2D([["a", "b"], ["c", "d"]], data_type=str)
+        words[0:1, 0:2] = np.array([["e", "f"]], dtype=object)
+        assert str(words) == "[[e, f], [c, d]]"
+        with pytest.raises(TypeError):
+            words[0:1, 0:2] = np.array([[1, 2]])
+        with pytest.raises(TypeError):
+            words[1][0:2] = np.array([1, 2], dtype=object)
+
+    # ✅ Test Fast Constructors
+    def test_full_and_zeros(self) -> None:
+        """Checks the one-shot constructors."""
+        assert str(Array2D.full(2, 3, 7)) == "[[7, 7, 7], [7, 7, 7]]"
+        assert Array2D.zeros(2, 2, data_type=int).sum() == 0
+        assert Array2D.zeros(1, 1)[0, 0] == 0.0
+        with pytest.raises(TypeError):
+            Array2D.full(2, 2, "seven", data_type=int)
+        with pytest.raises(ValueError):
+            Array2D.zeros(2, 2, data_type=str)
+        with pytest.raises(ValueError):
+            Array2D.empty(-1, 2, data_type=int)
+
+    # ✅ Test Empty Object Arrays
+    def test_empty_object_cells_are_distinct(self) -> None:
+        """Ensures every cell of an empty object array is its own instance."""
+        lists = Array2D.empty(2, 2, data_type=list)
+        lists[0, 0].append(1)
+        assert lists[0, 1] == []
+
+    # ✅ Test From Numpy
+    def test_from_numpy_shares_the_buffer(self) -> None:
+        """Checks that from_numpy wraps the ndarray without copying it."""
+        values = np.arange(6).reshape(2, 3)
+        array2d = Array2D.from_numpy(values)
+        array2d[1, 2] = 50
+        assert values[1, 2] == 50
+        assert np.shares_memory(np.asarray(array2d), values)
+        assert Array2D.from_numpy(values, copy=True)[1, 2] == 50
+        with pytest.raises(ValueError):
+            Array2D.from_numpy(np.arange(3))
+
+    # ✅ Test Growing and Shrinking Rows
+    def test_row_growth_and_removal(self, filled3x3: Array2D[int]) -> None:
+        """Checks append_row, insert_row and delete_row."""
+        filled3x3.append_row([10, 11, 12])
+        filled3x3.insert_row(0, [0, 0, 0])
+        filled3x3.delete_row(2)
+        assert str(filled3x3) == "[[0, 0, 0], [1, 2, 3], [7, 8, 9], [10, 11, 12]]"
+        assert len(filled3x3) == 4
+        with pytest.raises(ValueError):
+            filled3x3.append_row([1, 2])
+        with pytest.raises(IndexError):
+            filled3x3.delete_row(4)
+
+    # ✅ Test Growing and Shrinking Columns
+    def test_column_growth_and_removal(self, filled3x3: Array2D[int]) -> None:
+        """Checks append_column and delete_column."""
+        filled3x3.append_column([30, 60, 90])
+        filled3x3.delete_column(0)
+        assert str(filled3x3) == "[[2, 3, 30], [5, 6, 60], [8, 9, 90]]"
+        with pytest.raises(TypeError):
+            filled3x3.append_column(["a", "b", "c"])
+
+    # ✅ Test Resize
+    def test_resize_keeps_items_and_fills_new_cells(self, filled3x3: Array2D[int]) -> None:
+        """Ensures resize keeps the overlapping items and fills the rest."""
+        filled3x3.resize(2, 4, fill=-1)
+        assert str(filled3x3) == "[[1, 2, 3, -1], [4, 5, 6, -1]]"
+        filled3x3.resize(3, 2)
+        assert str(filled3x3) == "[[1, 2], [4, 5], [0, 0]]"
+        grown = Array2D.empty(0, 0, data_type=int)
+        for i in range(5):
+            grown.append_row([i, i])
+        assert grown.sum(axis=0)[1] == 10
+
+    # ✅ Test Convolution
+    def test_convolve_with_each_boundary(self, filled3x3: Array2D[int]) -> None:
+        """Checks convolve against hand-computed stencils for every boundary mode."""
+        cross = [[0, 1, 0], [1, 1, 1], [0, 1, 0]]
+        assert str(filled3x3.convolve(cross)) == "[[7, 11, 11], [17, 25, 23], [19, 29, 23]]"
+        assert filled3x3.convolve(cross, boundary="wrap")[0, 0] == 1 + 2 + 3 + 4 + 7
+        assert filled3x3.convolve(cross, boundary="reflect")[0, 0] == 1 + 1 + 2 + 1 + 4
+        shifted = filled3x3.convolve(np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]))
+        assert shifted.data_type == float
+        assert str(shifted) == "[[4.0, 5.0, 6.0], [7.0, 8.0, 9.0], [0.0, 0.0, 0.0]]"
+        with pytest.raises(ValueError):
+            filled3x3.convolve([[1, 1]])
+        with pytest.raises(ValueError):
+            filled3x3.convolve(cross, boundary="nearest")
+        with pytest.raises(TypeError):
+            Array2D([["a"]], data_type=str).convolve([[1]])
+
+    # ✅ Test Neighbor Sums
+    def test_neighbor_sum_counts_live_neighbors(self) -> None:
+        """Checks neighbor_sum on a bool blinker, with and without wrapping."""
+        blinker = Array2D([[False, True, False]] * 3, data_type=bool)
+        counts = blinker.neighbor_sum()
+        assert counts.data_type == int
+        assert str(counts) == "[[2, 1, 2], [3, 2, 3], [2, 1, 2]]"
+        assert str(blinker.neighbor_sum(boundary="wrap")) == "[[3, 2, 3], [3, 2, 3], [3, 2, 3]]"
+
+    # ✅ Test Saving and Loading
+    def test_save_and_load_round_trip_each_format(self, filled3x3: Array2D[int], tmp_path) -> None:
+        """Checks .npy, .csv and Game of Life .txt files, and memory-mapped .npy files."""
+        filled3x3.save(tmp_path / "grid.npy")
+        loaded = Array2D.load(tmp_path / "grid.npy")
+        assert loaded.data_type == int and str(loaded) == str(filled3x3)
+        mapped = Array2D.load(tmp_path / "grid.npy", mmap=True)
+        with pytest.raises(ValueError):
+            mapped[0, 0] = 100
+        assert mapped[2, 2] == 9
+        del mapped
+        (tmp_path / "grid.npy").chmod(0o444)
+        assert Array2D.load(tmp_path / "grid.npy", mmap=True)[0, 0] == 1
+        (tmp_path / "grid.npy").chmod(0o644)
+        mapped = Array2D.load(tmp_path / "grid.npy", mmap=True, writable=True)
+        mapped[0, 0] = 100
+        del mapped
+        assert Array2D.load(tmp_path / "grid.npy")[0, 0] == 100
+        with pytest.raises(ValueError):
+            Array2D.load(tmp_path / "grid.npy", writable=True)
+
+        filled3x3.save(tmp_path / "grid.csv")
+        assert str(Array2D.load(tmp_path / "grid.csv", data_type=int)) == str(filled3x3)
+        assert Array2D.load(tmp_path / "grid.csv", data_type=float)[2, 2] == 9.0
+        words = Array2D([["a,b", "c"], ["d", "e"]], data_type=str)
+        words.save(tmp_path / "words.csv")
+        assert Array2D.load(tmp_path / "words.csv", data_type=str)[0, 0] == "a,b"
+
+        board = Array2D([[True, False, False], [False, True, True]], data_type=bool)
+        board.save(tmp_path / "board.csv")
+        assert str(Array2D.load(tmp_path / "board.csv", data_type=bool)) == str(board)
+        board.save(tmp_path / "board.txt")
+        assert (tmp_path / "board.txt").read_text().splitlines()[-2:] == ["X--", "-XX"]
+        assert str(Array2D.load(tmp_path / "board.txt")) == str(board)
+
+    def test_load_reads_the_game_of_life_start_file(self) -> None:
+        """Checks the #-comment rows/cols/X- format of the project config file."""
+        board = Array2D.load("projects/project2/start.txt")
+        assert len(board) == 7 and len(board[0]) == 30
+        assert list(board[3])[:6] == [False, True, False, False, False, True]
+
+    def test_load_rejects_bad_files(self, filled3x3: Array2D[int], tmp_path) -> None:
+        """Checks the errors for unknown types, missing data types and malformed rows."""
+        with pytest.raises(ValueError):
+            filled3x3.save(tmp_path / "grid.json")
+        filled3x3.save(tmp_path / "grid.csv")
+        with pytest.raises(ValueError):
+            Array2D.load(tmp_path / "grid.csv")
+        with pytest.raises(ValueError):
+            Array2D.load(tmp_path / "grid.csv", data_type=int, mmap=True)
+        with pytest.raises(ValueError):
+            filled3x3.save(tmp_path / "grid.txt")
+        (tmp_path / "ragged.csv").write_text("1,2\n3\n")
+        with pytest.raises(ValueError):
+            Array2D.load(tmp_path / "ragged.csv", data_type=int)
+        (tmp_path / "short.txt").write_text("3\n2\nX-\n")
+        with pytest.raises(ValueError):
+            Array2D.load(tmp_path / "short.txt")
+        (tmp_path / "bools.csv").write_text("True,0\nfalse,yes\n")
+        with pytest.raises(ValueError):
+            Array2D.load(tmp_path / "bools.csv", data_type=bool)
+
+    # ✅ Test Shape Changes on Borrowed Buffers
+    def test_shape_changes_on_views_leave_the_parent_unchanged(self, filled3x3: Array2D[int]) -> None:
+        """Ensures deleting from windows and transposes, or resizing from_numpy arrays, copies first."""
+        window = filled3x3[0:2]
+        window.delete_row(0)
+        assert str(window) == "[[4, 5, 6]]"
+        assert str(filled3x3) == "[[1, 2, 3], [4, 5, 6], [7, 8, 9]]"
+        window[0, 0] = 40
+        assert filled3x3[1, 0] == 4
+        words = Array2D([["a", "b"], ["c", "d"], ["e", "f"]], data_type=str)
+        transposed = words.T
+        transposed.delete_column(0)
+        assert str(transposed) == "[[c, e], [d, f]]"
+        assert str(words) == "[[a, b], [c, d], [e, f]]"
+        values = np.arange(6).reshape(2, 3)
+        wrapped = Array2D.from_numpy(values)
+        wrapped.resize(1, 2)
+        assert values.tolist() == [[0, 1, 2], [3, 4, 5]]
+
+    # ✅ Test Copying
+    def test_deepcopy_keeps_rows_and_cells_in_sync(self, filled3x3: Array2D[int]) -> None:
+        """Ensures cached Rows of a deep copy view the copy's own buffer."""
+        _ = filled3x3[0]
+        copied = copy.deepcopy(filled3x3)
+        copied[0][0] = 99
+        assert copied[0, 0] == 99
+        assert filled3x3[0, 0] == 1
+        copied.append_row([10, 11, 12])
+        assert str(copied) == "[[99, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]"
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from datastructures.array2d import Array2D
+from datastructures.bitarray2d import BitArray2D
+
+
+class TestBitArray2D:
+    @pytest.fixture
+    def setup_bits(self) -> BitArray2D:
+        return BitArray2D([[c % 3 == r for c in range(70)] for r in range(3)])
+
+    def test_cells_should_be_packed_64_to_a_word(self, setup_bits: BitArray2D):
+        assert setup_bits.words.shape == (3, 2)
+        assert setup_bits[0, 0] and setup_bits[0, 69] and not setup_bits[0, 68]
+        assert setup_bits[1][67] and setup_bits[-1, -2]
+        assert setup_bits.popcount() == 70
+
+    def test_setting_cells_should_flip_single_bits(self, setup_bits: BitArray2D):
+        setup_bits[2, 66] = True
+        setup_bits[0][0] = False
+        assert setup_bits[2, 66] and not setup_bits[0, 0]
+        assert setup_bits.popcount() == 70
+        with pytest.raises(TypeError):
+            setup_bits[0, 1] = 1
+        with pytest.raises(IndexError):
+            setup_bits[3, 0]
+        with pytest.raises(IndexError):
+            setup_bits[0, 70] = True
+
+    def test_bitwise_operators_should_combine_cell_by_cell(self):
+        a = BitArray2D([[True, True, False, False]])
+        b = BitArray2D([[True, False, True, False]])
+        assert list((a & b)[0]) == [True, False, False, False]
+        assert list((a | b)[0]) == [True, True, True, False]
+        assert list((a ^ b)[0]) == [False, True, True, False]
+        assert list((~a)[0]) == [False, False, True, True]
+        a |= b
+        assert a.popcount() == 3
+        with pytest.raises(ValueError):
+            a & BitArray2D([[True]])
+
+    def test_shifts_should_move_cells_along_their_rows_across_words(self, setup_bits: BitArray2D):
+        shifted = setup_bits << 65
+        assert [c for c in range(70) if shifted[0, c]] == [65, 68]
+        assert [c for c in range(70) if (setup_bits >> 66)[0, c]] == [0, 3]
+        assert (setup_bits << 70).popcount() == 0
+        assert (setup_bits << 0) == setup_bits
+        with pytest.raises(ValueError):
+            setup_bits << -1
+
+    def test_converting_to_and_from_a_bool_array2d_should_keep_the_cells(self, setup_bits: BitArray2D):
+        dense = setup_bits.to_dense()
+        assert dense.data_type == bool
+        assert [list(row) for row in dense] == [[c % 3 == r for c in range(70)] for r in range(3)]
+        assert BitArray2D.from_dense(dense) == setup_bits
+        with pytest.raises(TypeError):
+            BitArray2D.from_dense(Array2D([[1]], data_type=int))
+        with pytest.raises(ValueError):
+            BitArray2D([[1]], data_type=int)
+
+    def test_empty_should_hold_only_false_cells(self):
+        board = BitArray2D.empty(1000, 1000)
+        assert board.words.nbytes == 1000 * 16 * 8
+        assert board.popcount() == 0 and not board[999, 999]
+
+    def test_popcount_should_not_need_numpy_2(self, setup_bits: BitArray2D, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delattr(np, 'bitwise_count', raising=False)
+        assert setup_bits.popcount() == 70
+        assert BitArray2D.empty(0, 0).popcount() == 0
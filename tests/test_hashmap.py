@@ -52,3 +52,23 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_equal_keys_of_different_types_share_an_entry(self, empty_hashmap: HashMap[int, str]):
+        empty_hashmap[1] = "one"
+        assert empty_hashmap[1.0] == "one"
+        empty_hashmap[True] = "true"
+        assert len(empty_hashmap) == 1
+
+    def test_unhashable_keys_fall_back_to_a_stable_hash(self, empty_hashmap: HashMap[int, str]):
+        empty_hashmap[[1, 2]] = "list"
+        assert empty_hashmap[[1, 2]] == "list"
+        assert [2, 1] not in empty_hashmap
+
+    def test_stable_hash_function_is_seeded_and_deterministic(self):
+        hash_function = HashMap.stable_hash_function(seed=42)
+        assert hash_function("key") == HashMap.stable_hash_function(seed=42)("key")
+        assert hash_function("key") != HashMap.stable_hash_function(seed=43)("key")
+        hashmap = HashMap[str, int](custom_hash_function=hash_function)
+        for i in range(50):
+            hashmap[str(i)] = i
+        assert all(hashmap[str(i)] == i for i in range(50))
@@ -0,0 +1,75 @@
+import pytest
+from datastructures.ropearray import RopeArray
+
+from tests.car import Car, Color, Make, Model
+
+class TestRopeArray:
+    car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
+    car2 = Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)
+
+    @pytest.fixture
+    def setup_numerical_rope(self) -> RopeArray[int]:
+        return RopeArray[int](starting_sequence=[i for i in range(100)], data_type=int, chunk_size=8)
+
+    def test_index_operator_should_return_the_item_at_the_index_specified(self, setup_numerical_rope: RopeArray):
+        assert setup_numerical_rope[0] == 0
+        assert setup_numerical_rope[57] == 57
+        assert setup_numerical_rope[-1] == 99
+
+    def test_index_operator_should_raise_an_IndexError_exception_if_the_index_is_out_of_bounds(self, setup_numerical_rope: RopeArray):
+        with pytest.raises(IndexError):
+            setup_numerical_rope[100]
+        with pytest.raises(IndexError):
+            setup_numerical_rope[-101]
+
+    def test_inserting_in_the_middle_should_split_full_chunks_and_keep_the_order(self, setup_numerical_rope: RopeArray):
+        expected = list(range(100))
+        for i in range(50):
+            setup_numerical_rope.insert(50, -i)
+            expected.insert(50, -i)
+        assert list(setup_numerical_rope) == expected
+        assert list(reversed(setup_numerical_rope)) == expected[::-1]
+        assert [setup_numerical_rope[i] for i in range(len(expected))] == expected
+
+    def test_deleting_should_remove_empty_chunks_and_keep_the_order(self, setup_numerical_rope: RopeArray):
+        expected = list(range(100))
+        for index in (0, -1, 40, 40, 40, 40, 40, 40, 40, 40, 10):
+            del setup_numerical_rope[index]
+            del expected[index]
+        while len(expected) > 5:
+            del setup_numerical_rope[len(expected) // 2]
+            del expected[len(expected) // 2]
+        assert list(setup_numerical_rope) == expected
+        assert len(setup_numerical_rope) == len(expected)
+
+    def test_append_and_pop_should_work_at_both_ends(self):
+        rope = RopeArray[int](data_type=int, chunk_size=4)
+        for i in range(10):
+            rope.append(i)
+            rope.append_front(-i)
+        rope.pop()
+        rope.pop_front()
+        assert list(rope) == [-i for i in range(8, 0, -1)] + [0] + list(range(9))
+        rope.clear()
+        assert len(rope) == 0
+        with pytest.raises(IndexError):
+            rope.pop()
+
+    def test_slicing_should_return_a_new_rope(self, setup_numerical_rope: RopeArray):
+        sliced = setup_numerical_rope[10:20:3]
+        assert list(sliced) == [10, 13, 16, 19]
+        sliced[0] = 0
+        assert setup_numerical_rope[10] == 10
+
+    def test_setting_or_inserting_the_wrong_type_should_raise_a_type_error(self, setup_numerical_rope: RopeArray):
+        with pytest.raises(TypeError):
+            setup_numerical_rope[0] = 'a'
+        with pytest.raises(TypeError):
+            setup_numerical_rope.insert(0, 'a')
+
+    def test_a_rope_of_objects_should_hold_the_objects(self):
+        rope = RopeArray[Car](starting_sequence=[self.car1], data_type=Car)
+        rope.insert(0, self.car2)
+        assert rope[0] == self.car2 and rope[1] == self.car1
+        assert self.car1 in rope
+        assert rope == RopeArray[Car](starting_sequence=[self.car2, self.car1], data_type=Car)
@@ -0,0 +1,56 @@
+import pytest
+
+from datastructures.array2d import Array2D
+from datastructures.sparsearray2d import SparseArray2D
+
+class TestSparseArray2D:
+
+    @pytest.fixture
+    def sparse3x3(self) -> SparseArray2D[int]:
+        """Returns a 3x3 SparseArray2D with two stored cells."""
+        return SparseArray2D([[0, 0, 3], [0, 0, 0], [7, 0, 0]], data_type=int)
+
+    def test_only_non_default_cells_are_stored(self, sparse3x3: SparseArray2D[int]) -> None:
+        """Checks that defaults are not stored and every cell can still be read."""
+        assert sparse3x3.nnz == 2
+        assert sparse3x3[0][2] == 3 and sparse3x3[1, 1] == 0
+        assert [list(row) for row in sparse3x3] == [[0, 0, 3], [0, 0, 0], [7, 0, 0]]
+        assert list(sparse3x3.items()) == [(0, 2, 3), (2, 0, 7)]
+
+    def test_setting_the_default_removes_the_cell(self, sparse3x3: SparseArray2D[int]) -> None:
+        """Ensures writes add and remove stored cells."""
+        sparse3x3[1][1] = 5
+        sparse3x3[0, 2] = 0
+        assert sparse3x3.nnz == 2
+        assert list(sparse3x3.items()) == [(1, 1, 5), (2, 0, 7)]
+        with pytest.raises(TypeError):
+            sparse3x3[0, 0] = "five"
+        with pytest.raises(IndexError):
+            _ = sparse3x3[3, 0]
+
+    def test_csr_layout_reads_and_writes(self, sparse3x3: SparseArray2D[int]) -> None:
+        """Checks compress() and that writes to new cells switch back to dok."""
+        sparse3x3.compress()
+        assert sparse3x3.layout == 'csr'
+        assert sparse3x3[2, 0] == 7 and sparse3x3[2, 1] == 0
+        sparse3x3[2, 0] = 70
+        assert sparse3x3.layout == 'csr'
+        sparse3x3[2, 2] = 9
+        assert sparse3x3.layout == 'dok'
+        assert str(sparse3x3) == "[[0, 0, 3], [0, 0, 0], [70, 0, 9]]"
+
+    def test_dense_conversion(self, sparse3x3: SparseArray2D[int]) -> None:
+        """Ensures conversion to and from Array2D keeps every cell."""
+        dense = sparse3x3.to_dense()
+        assert str(dense) == "[[0, 0, 3], [0, 0, 0], [7, 0, 0]]"
+        sparse = SparseArray2D.from_dense(dense)
+        assert sparse.layout == 'csr' and sparse.nnz == 2
+        assert str(sparse) == str(dense)
+        assert SparseArray2D.from_dense(Array2D([["", "x"]], data_type=str)).nnz == 1
+
+    def test_empty_uses_a_custom_default(self) -> None:
+        """Checks empty() with a default other than data_type()."""
+        sparse = SparseArray2D.empty(1000, 1000, data_type=str, default=".")
+        sparse[999, 999] = "X"
+        assert sparse[0, 0] == "." and sparse[-1, -1] == "X"
+        assert sparse.nnz == 1
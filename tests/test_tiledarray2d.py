@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from datastructures.array2d import Array2D
+from datastructures.tiledarray2d import TiledArray2D
+
+
+def double(tile):
+    return tile * 2
+
+
+def total(tile):
+    return np.full_like(tile, tile.sum())
+
+
+class TestTiledArray2D:
+    @pytest.fixture
+    def setup_tiled(self) -> TiledArray2D[int]:
+        return TiledArray2D[int]([[r * 10 + c for c in range(7)] for r in range(5)], data_type=int, tile_size=3)
+
+    def test_cells_should_be_readable_and_writable_across_tiles(self, setup_tiled: TiledArray2D):
+        assert setup_tiled[4, 6] == 46
+        assert setup_tiled[-1][-2] == 45
+        assert list(setup_tiled[2]) == [20, 21, 22, 23, 24, 25, 26]
+        setup_tiled[3, 4] = -1
+        setup_tiled[0][5] = -2
+        assert setup_tiled[3, 4] == -1 and setup_tiled[0, 5] == -2
+        with pytest.raises(IndexError):
+            setup_tiled[5, 0]
+        with pytest.raises(IndexError):
+            setup_tiled[0, 7]
+        with pytest.raises(TypeError):
+            setup_tiled[0, 0] = 'a'
+
+    def test_tiles_should_yield_trimmed_views_in_row_major_order(self, setup_tiled: TiledArray2D):
+        tiles = list(setup_tiled.tiles())
+        assert [(i, j) for i, j, _ in tiles] == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+        assert [view.shape for _, _, view in tiles] == [(3, 3), (3, 3), (3, 1), (2, 3), (2, 3), (2, 1)]
+        assert tiles[4][2].tolist() == [[33, 34, 35], [43, 44, 45]]
+        assert tiles[0][2].flags.c_contiguous
+        tiles[5][2][:] = 0
+        assert setup_tiled[3, 6] == 0 and setup_tiled[4, 6] == 0
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_map_tiles_should_apply_the_function_to_every_tile(self, setup_tiled: TiledArray2D, workers: int):
+        doubled = setup_tiled.map_tiles(double, workers=workers)
+        assert [list(row) for row in doubled] == [[2 * (r * 10 + c) for c in range(7)] for r in range(5)]
+        sums = setup_tiled.map_tiles(total, workers=workers)
+        assert sums[0, 0] == sum(r * 10 + c for r in range(3) for c in range(3))
+        assert sums[4, 6] == 36 + 46
+        assert setup_tiled[1, 1] == 11
+        with pytest.raises(ValueError):
+            setup_tiled.map_tiles(double, workers=0)
+
+    def test_converting_to_and_from_dense_should_keep_the_items(self, setup_tiled: TiledArray2D):
+        dense = setup_tiled.to_dense()
+        assert isinstance(dense, Array2D)
+        assert [list(row) for row in dense] == [[r * 10 + c for c in range(7)] for r in range(5)]
+        tiled = TiledArray2D.from_dense(Array2D([['a', 'b'], ['c', 'd']], data_type=str), tile_size=64)
+        assert tiled[1, 0] == 'c' and len(list(tiled.tiles())) == 1
+        assert str(tiled.to_dense()) == str(Array2D([['a', 'b'], ['c', 'd']], data_type=str))
+
+    def test_empty_should_build_the_default_items(self):
+        tiled = TiledArray2D.empty(70, 130, data_type=float)
+        assert len(tiled) == 70 and len(tiled[0]) == 130
+        assert tiled[69, 129] == 0.0
+        assert len(list(tiled.tiles())) == 6
+        assert len(TiledArray2D.empty(0, 0, int)) == 0
+        with pytest.raises(ValueError):
+            TiledArray2D([[1]], data_type=int, tile_size=0)